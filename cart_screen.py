@@ -16,6 +16,30 @@ except ImportError:
     print("[CartScreen] WARNING: stock_tracker not available")
 
 
+def _price_cents(price):
+    """Convert a peso price to integer centavos so cart totals add up exactly."""
+    return int(round(float(price) * 100))
+
+
+class CartEntry:
+    """One line of the live cart: an item payload and how many of it are in the cart."""
+
+    __slots__ = ("item", "quantity")
+
+    def __init__(self, item, quantity):
+        self.item = item
+        self.quantity = quantity
+
+    def as_dict(self):
+        """Plain {"item", "quantity"} dict, as used by the vending, stock and logging paths."""
+        return {"item": self.item, "quantity": self.quantity}
+
+
+def _cart_total(cart_entries):
+    """Exact total of CartEntry objects, summed in centavos."""
+    return sum(_price_cents(entry.item["price"]) * entry.quantity for entry in cart_entries) / 100
+
+
 class CartScreen(tk.Frame):
     def __init__(self, parent, controller):
         tk.Frame.__init__(self, parent, bg="#f0f4f8")
@@ -279,13 +303,12 @@ class CartScreen(tk.Frame):
                 pass
             return
 
-        grand_total = 0
+        grand_total = _cart_total(cart_items)
         self.checkout_button.config(state="normal")
         for item_info in cart_items:
-            item = item_info["item"]
-            quantity = item_info["quantity"]
-            total_price = item["price"] * quantity
-            grand_total += total_price
+            item = item_info.item
+            quantity = item_info.quantity
+            total_price = _price_cents(item["price"]) * quantity / 100
 
             item_frame = tk.Frame(
                 self.cart_items_frame,
@@ -828,7 +851,7 @@ class CartScreen(tk.Frame):
         self.buyer_info = info
 
         # Calculate total amount needed
-        total_amount = sum(item["item"]["price"] * item["quantity"] for item in self.controller.cart)
+        total_amount = _cart_total(self.controller.cart.values())
         
         if not self.payment_in_progress:
             # Start payment session
@@ -1101,12 +1124,11 @@ class CartScreen(tk.Frame):
             ).pack(fill="x", pady=(0, 6))
 
             items_list_lines = []
-            for entry in self.controller.cart:
-                item_data = entry.get("item", {})
+            for entry in self.controller.cart.values():
+                item_data = entry.item or {}
                 item_name = item_data.get("name", "Unknown Item")
-                qty = int(entry.get("quantity", 0) or 0)
-                unit_price = float(item_data.get("price", 0.0) or 0.0)
-                line_total = qty * unit_price
+                qty = int(entry.quantity or 0)
+                line_total = _price_cents(item_data.get("price", 0.0) or 0.0) * qty / 100
                 slot_no = item_data.get("_slot_number")
                 slot_text = f" (Slot {slot_no})" if slot_no is not None else ""
                 items_list_lines.append(
@@ -1358,7 +1380,7 @@ class CartScreen(tk.Frame):
 
         thread_args = (
             self.payment_required,
-            list(self.controller.cart),
+            [entry.as_dict() for entry in self.controller.cart.values()],
             self.coin_received,
             self.bill_received,
             self.buyer_info
@@ -26,6 +26,8 @@ class DailySalesLogger:
         """
         self.logs_dir = logs_dir
         self._lock = Lock()
+        # Bumped on every transaction write so viewers can tell when summaries are stale.
+        self.transaction_revision = 0
         
         # Create logs directory if it doesn't exist
         try:
@@ -136,6 +138,7 @@ class DailySalesLogger:
                 try:
                     with open(log_file, "a", encoding="utf-8") as f:
                         f.write(log_entry + "\n")
+                    self.transaction_revision += 1
                     print(f"[Logger] Transaction logged: {items_str}")
                 except Exception as e:
                     print(f"[Logger] ERROR writing transaction log: {e}")
@@ -9,8 +9,11 @@ Usage example from kiosk code:
 The module sends a single-line command and reads a single-line response.
 """
 import socket
+import select
+import errno
 import sys
 import time
+import threading
 import subprocess
 import os
 try:
@@ -24,6 +27,31 @@ logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 
 # Persistent TCP connections cache: host -> socket
 _tcp_sockets = {}
+# One lock per cached connection so a command and its reply line are never
+# interleaved with another thread's exchange on the same socket.
+_tcp_locks = {}
+_tcp_locks_guard = threading.Lock()
+# Serial port that last answered send_command's USB fallback scan, if any.
+_serial_fallback_port = None
+
+
+def _tcp_lock(host, port):
+    """Return the lock guarding the persistent connection to host:port."""
+    key = f"{host}:{port}"
+    with _tcp_locks_guard:
+        lock = _tcp_locks.get(key)
+        if lock is None:
+            lock = _tcp_locks[key] = threading.Lock()
+        return lock
+
+def _set_nodelay(s):
+    """Commands are single short lines answered by one line; send them
+    immediately instead of letting Nagle hold them for an ACK."""
+    try:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
+
 
 def _close_tcp(host, port=None):
     """Close and remove cached TCP socket for host:port key.
@@ -56,6 +84,7 @@ def _open_tcp(host, port, timeout):
     logging.info(f"Opening TCP connection to {host}:{port}")
     try:
         s = socket.create_connection((host, port), timeout=timeout)
+        _set_nodelay(s)
         # set a read timeout; callers may change this temporarily
         s.settimeout(timeout)
         _tcp_sockets[key] = s
@@ -217,48 +246,49 @@ def send_command(host, cmd, port=DEFAULT_PORT, timeout=2.0, retries=3, use_persi
     for attempt in range(1, retries + 1):
         try:
             if use_persistent_tcp:
-                # try to reuse an existing socket (open if needed)
-                try:
-                    s = _open_tcp(host, port, timeout)
-                except Exception as e:
-                    logging.warning(f"Persistent TCP open failed: {e}")
-                    # fall back to ephemeral connect below
-                    s = None
-
-                if s:
+                with _tcp_lock(host, port):
+                    # try to reuse an existing socket (open if needed)
                     try:
-                        # ensure socket timeout
-                        s.settimeout(timeout)
-                        s.sendall((cmd.strip() + "\n").encode('utf-8'))
-                        # read until newline or timeout
-                        resp_buf = b''
-                        start = time.time()
-                        while time.time() - start < timeout:
-                            try:
-                                chunk = s.recv(512)
-                            except socket.timeout:
-                                break
-                            if not chunk:
-                                break
-                            resp_buf += chunk
-                            if b'\n' in resp_buf:
-                                break
-                        if not resp_buf:
-                            # treat as timeout for this attempt
-                            last_exc = TimeoutError(f'TCP read timeout after {timeout}s')
-                            # close and retry (reconnect next attempt)
-                            logging.info("No TCP response, closing persistent socket and retrying")
+                        s = _open_tcp(host, port, timeout)
+                    except Exception as e:
+                        logging.warning(f"Persistent TCP open failed: {e}")
+                        # fall back to ephemeral connect below
+                        s = None
+
+                    if s:
+                        try:
+                            # ensure socket timeout
+                            s.settimeout(timeout)
+                            s.sendall((cmd.strip() + "\n").encode('utf-8'))
+                            # read until newline or timeout
+                            resp_buf = b''
+                            start = time.time()
+                            while time.time() - start < timeout:
+                                try:
+                                    chunk = s.recv(512)
+                                except socket.timeout:
+                                    break
+                                if not chunk:
+                                    break
+                                resp_buf += chunk
+                                if b'\n' in resp_buf:
+                                    break
+                            if not resp_buf:
+                                # treat as timeout for this attempt
+                                last_exc = TimeoutError(f'TCP read timeout after {timeout}s')
+                                # close and retry (reconnect next attempt)
+                                logging.info("No TCP response, closing persistent socket and retrying")
+                                _close_tcp(host, port)  # Close socket to clean up resource
+                                time.sleep(0.05)
+                                continue
+                            line = resp_buf.split(b'\n', 1)[0]
+                            return line.decode('utf-8', errors='ignore').strip()
+                        except Exception as e:
+                            last_exc = e
+                            logging.warning(f"Persistent TCP operation failed: {e}")
                             _close_tcp(host, port)  # Close socket to clean up resource
                             time.sleep(0.05)
                             continue
-                        line = resp_buf.split(b'\n', 1)[0]
-                        return line.decode('utf-8', errors='ignore').strip()
-                    except Exception as e:
-                        last_exc = e
-                        logging.warning(f"Persistent TCP operation failed: {e}")
-                        _close_tcp(host, port)  # Close socket to clean up resource
-                        time.sleep(0.05)
-                        continue
 
             # fallback ephemeral TCP connect (works even if persistent failed)
             with socket.create_connection((host, port), timeout=timeout) as s2:
@@ -306,15 +336,22 @@ def send_command(host, cmd, port=DEFAULT_PORT, timeout=2.0, retries=3, use_persi
                 # common device names on Linux
                 ports = ['/dev/ttyACM0', '/dev/ttyACM1', '/dev/ttyUSB0', '/dev/ttyUSB1', '/dev/ttyS0']
 
+        global _serial_fallback_port
+        # Try the port that answered last time first.
+        known = _serial_fallback_port
+        if known:
+            ports = [known] + [p for p in ports if p != known]
         for p in ports:
             try:
                 logging.info(f"Trying serial port fallback: {p}")
                 resp = send_command(f'serial:{p}', cmd, timeout=timeout, retries=1)
                 logging.info(f"Serial fallback succeeded on {p}")
+                _serial_fallback_port = p
                 return resp
             except Exception as e:
                 logging.debug(f"Serial port {p} failed: {e}")
                 continue
+        _serial_fallback_port = None
 
     # exhausted all transports
     raise last_exc
@@ -330,6 +367,54 @@ def pulse_slot(host, slot, ms=800, port=DEFAULT_PORT, timeout=2.0):
     return send_command(host, cmd, port=port, timeout=timeout, retries=1)
 
 
+_CONNECT_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', errno.EWOULDBLOCK)}
+
+
+def ping(host, port=DEFAULT_PORT, timeout=0.5):
+    """Return True if a command to the ESP32 still has a transport to try.
+
+    Serial hosts, and a board that last answered over the USB fallback in
+    `send_command`, count as reachable without probing. Otherwise an existing
+    persistent connection counts, or a non-blocking connect is given
+    `timeout` seconds; on success the socket is cached for the next
+    `send_command`. False means neither TCP nor a known serial port is left.
+    """
+    if isinstance(host, str) and host.startswith('serial:'):
+        return True
+    if _serial_fallback_port is not None:
+        return True
+    return _tcp_probe(host, port, timeout)
+
+
+def _tcp_probe(host, port, timeout):
+    """Non-blocking TCP connect to host:port, caching the socket on success."""
+    key = f"{host}:{port}"
+    if key in _tcp_sockets:
+        return True
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        s.setblocking(False)
+        if s.connect_ex((host, port)) not in _CONNECT_IN_PROGRESS:
+            s.close()
+            return False
+        _, writable, _ = select.select([], [s], [], timeout)
+        if not writable or s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+            s.close()
+            return False
+        s.setblocking(True)
+        _set_nodelay(s)
+        s.settimeout(timeout)
+    except OSError:
+        s.close()
+        return False
+    with _tcp_lock(host, port):
+        if key in _tcp_sockets:
+            s.close()
+        else:
+            _tcp_sockets[key] = s
+    return True
+
+
 def open_slot(host, slot, port=DEFAULT_PORT):
     return send_command(host, f"OPEN {int(slot)}", port=port)
 
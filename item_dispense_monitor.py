@@ -220,7 +220,7 @@ class ItemDispenseMonitor:
     """
     
     def __init__(self, ir_sensor_pins=[6, 5], default_timeout=15.0, detection_mode='any', simulate_detection=False,
-                 use_esp32_serial=False, serial_port=None, serial_baud=115200):
+                 use_esp32_serial=False, serial_port=None, serial_baud=115200, change_only=False):
         """
         Initialize item dispense monitor.
         
@@ -233,6 +233,7 @@ class ItemDispenseMonitor:
                 - 'first': Item is dispensed when FIRST sensor detects obstruction (fastest detection)
             simulate_detection (bool): If True, simulate successful item detection for testing (no real sensors)
             use_esp32_serial (bool): If True, read IR states from ESP32 serial instead of GPIO.
+            change_only (bool): If True, only call the IR status callback when the readings change.
         """
         self.ir_sensor_pins = ir_sensor_pins
         self.default_timeout = default_timeout
@@ -278,6 +279,8 @@ class ItemDispenseMonitor:
         self._on_dispense_timeout = None  # callback(slot_id, elapsed_time)
         self._on_dispense_status = None  # callback(slot_id, status_msg)
         self._on_ir_status_update = None  # callback(sensor_1, sensor_2, detection_mode, last_detection)
+        self.change_only = change_only
+        self._last_ir_status = None  # (sensor_1, sensor_2, detection_mode) last pushed to the callback
         
         print(f"[ItemDispenseMonitor] Initialized with {len(ir_sensor_pins)} IR sensors in bin area")
         print(f"[ItemDispenseMonitor] Detection mode: {detection_mode.upper()}")
@@ -383,12 +386,15 @@ class ItemDispenseMonitor:
                     try:
                         sensor_1 = sensor_readings[0][1] if len(sensor_readings) > 0 else None
                         sensor_2 = sensor_readings[1][1] if len(sensor_readings) > 1 else None
-                        self._on_ir_status_update(
-                            sensor_1=sensor_1,
-                            sensor_2=sensor_2,
-                            detection_mode=self.detection_mode,
-                            last_detection=None
-                        )
+                        ir_status = (sensor_1, sensor_2, self.detection_mode)
+                        if not (self.change_only and ir_status == self._last_ir_status):
+                            self._last_ir_status = ir_status
+                            self._on_ir_status_update(
+                                sensor_1=sensor_1,
+                                sensor_2=sensor_2,
+                                detection_mode=self.detection_mode,
+                                last_detection=None
+                            )
                     except Exception as e:
                         print(f"[ItemDispenseMonitor] IR status callback error: {e}")
 
@@ -1,22 +1,210 @@
 import tkinter as tk
 from tkinter import font as tkfont, ttk
 from PIL import Image
+try:
+    from PIL import ImageTk
+except Exception:
+    ImageTk = None
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
 import os
 import io
 import re
 import platform
-from collections import deque
+import functools
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque, OrderedDict
 from dht22_handler import DHT22Display
 from system_status_panel import SystemStatusPanel
-from fix_paths import get_absolute_path
+from fix_paths import get_absolute_path, get_project_root
+
+logger = logging.getLogger(__name__)
 
 def pil_to_photoimage(pil_image):
-    """Convert PIL Image to Tkinter PhotoImage using PPM format (no ImageTk needed)"""
+    """Convert PIL Image to Tkinter PhotoImage.
+
+    Uses ImageTk to blit pixels straight into Tk; falls back to a PPM
+    round-trip on installs without the ImageTk extension.
+    """
+    if ImageTk is not None:
+        return ImageTk.PhotoImage(pil_image)
     with io.BytesIO() as output:
         pil_image.save(output, format="PPM")
         data = output.getvalue()
     return tk.PhotoImage(data=data)
 
+# Detect if running on Raspberry Pi for better card sizing (once, at import).
+_IS_PI = platform.machine() in ('armv7l', 'armv6l', 'aarch64')
+# Card (width, height, spacing) in inches.
+if _IS_PI:
+    # On Pi 7" touchscreen (1024x600), use smaller cards for 4-5 per row; 0.3cm spacing
+    _CARD_SIZE_INCHES = (1.5, 2.2, 0.3 / 2.54)
+else:
+    # On larger desktop displays, use standard sizing; 0.5cm spacing
+    _CARD_SIZE_INCHES = (2.0, 3.0, 0.5 / 2.54)
+
+# Stock tiers for item cards: (status, border/badge color, badge prefix).
+_STOCK_OUT = ('out_of_stock', '#e74c3c', 'OUT')  # Red
+_STOCK_LOW = ('low_stock', '#f39c12', 'LOW')     # Orange/Yellow
+_STOCK_OK = ('in_stock', '#27ae60', 'OK')        # Green
+
+# Substring keywords for normalizing raw category names; the first rule (in
+# order) with any keyword contained in the text wins.
+_CATEGORY_NORMALIZE_RULES = (
+    ("Resistor", ("resistor", "ohm")),
+    ("Capacitor", ("capacitor", "farad", "uf", "pf")),
+    ("IC", ("integrated circuit", "logic ic")),
+    ("Amplifier", ("amplifier", "opamp", "op-amp")),
+    ("Board", ("board", "pcb", "breadboard", "arduino", "uno", "shield")),
+    ("Bundle", ("bundle", "kit", "pack", "solder")),
+    ("Wires", ("wire", "jumper", "cable", "cord", "lead", "awg", "alligator")),
+    ("Switches", ("switch", "button", "push button")),
+    ("Semiconductor", ("diode", "transistor", "led", "regulator")),
+    ("Sensor", ("sensor", "pir", "photodiode", "ir")),
+)
+
+
+def _build_normalize_automaton():
+    """Aho-Corasick automaton over all normalize keywords (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rule_idx, (normalized, keywords) in enumerate(_CATEGORY_NORMALIZE_RULES):
+        for keyword in keywords:
+            # Keep the earliest rule for a keyword shared by several rules.
+            if keyword not in automaton:
+                automaton.add_word(keyword, (rule_idx, normalized))
+    automaton.make_automaton()
+    return automaton
+
+
+_NORMALIZE_AUTOMATON = _build_normalize_automaton()
+
+
+def _match_normalized_category(text):
+    """Return the first-ranked normalized category whose keyword occurs in lowercased text."""
+    if _NORMALIZE_AUTOMATON is not None:
+        # One linear pass finds every keyword; the lowest rule index wins.
+        best = min((value for _end, value in _NORMALIZE_AUTOMATON.iter(text)), default=None)
+        return best[1] if best else None
+    # Without the automaton, plain substring tests win: keywords are short
+    # literals and `in` runs in C, while a regex alternation needs a lookahead
+    # per position to honour rule order and measured several times slower.
+    for normalized, keywords in _CATEGORY_NORMALIZE_RULES:
+        for keyword in keywords:
+            if keyword in text:
+                return normalized
+    return None
+
+
+# Keyword rules for classifying items by name. They are compiled once into a
+# single alternation so a name is scanned once in C; each named group maps
+# back to its category.
+_CATEGORY_RULES = {
+    'Resistor': [r'\bresistor\b', r'\br\d+\b', r'\bohm\b', r'\bkohm\b'],
+    'Capacitor': [r'\bcapacitor\b', r'\bfarad\b', r'\buf\b', r'\bpf\b'],
+    'IC': [r'\bic\d+\b', r'\bintegrated\s*circuit\b', r'\b74(?:ls)?\d+\b', r'\b555\b', r'\blm\d+\b'],
+    'Amplifier': [r'\bamplifier\b', r'\bop[- ]?amp\b'],
+    'Board': [r'\bboard\b', r'\bpcb\b', r'\bbreadboard\b', r'\bshield\b', r'\barduino\b', r'\buno\b'],
+    'Bundle': [r'\bbundle\b', r'\bkit\b', r'\bpack\b', r'\bsolder\b'],
+    'Wires': [r'\bwire(?:s)?\b', r'\bjumper\b', r'\bcable\b', r'\bcord\b', r'\blead(?:s)?\b', r'\bawg\b', r'\balligator\b'],
+    'Switches': [r'\bswitch(?:es)?\b', r'\bpush\s*button(?:s)?\b', r'\bbutton(?:s)?\b'],
+    'Semiconductor': [r'\bdiode\b', r'\btransistor\b', r'\bled\b', r'\bregulator\b'],
+    'Sensor': [r'\bsensor\b', r'\bpir\b', r'\bphotodiode\b', r'\bir\b'],
+}
+
+
+def _build_category_regex():
+    """Compile _CATEGORY_RULES into one regex plus a {group name: category} map."""
+    group_names = {}
+    alternatives = []
+    for cat, patterns in _CATEGORY_RULES.items():
+        for pattern in patterns:
+            group = f"g{len(alternatives)}"
+            group_names[group] = cat
+            alternatives.append(f"(?P<{group}>{pattern})")
+    return re.compile("|".join(alternatives), re.IGNORECASE), group_names
+
+
+_CATEGORY_REGEX, _CATEGORY_GROUP_NAMES = _build_category_regex()
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_item_name(normalized_name):
+    """Classify a stripped, lowercased item name into a sorted tuple of categories."""
+    if not normalized_name:
+        return ("Misc",)
+
+    categories = set()
+    searchable_parts = [normalized_name]
+
+    # Capture meaningful chunks from "CODE - CATEGORY - DETAILS" style names.
+    for part in [p.strip() for p in normalized_name.split(" - ") if p.strip()]:
+        searchable_parts.append(part)
+
+    # Tokenized fallback chunks for names with slashes/parentheses/commas.
+    for token in re.split(r"[/(),]", normalized_name):
+        token = token.strip()
+        if token:
+            searchable_parts.append(token)
+
+    for text in searchable_parts:
+        normalized_cat = _match_normalized_category(text)
+        if normalized_cat:
+            categories.add(normalized_cat)
+
+    # Parts are substrings split on non-word separators, so one scan of the
+    # full name finds every keyword the per-part scans would.
+    for match in _CATEGORY_REGEX.finditer(normalized_name):
+        categories.add(_CATEGORY_GROUP_NAMES[match.lastgroup])
+
+    return tuple(sorted(categories)) if categories else ("Misc",)
+
+
+def _category_field_key(value):
+    """Hashable stand-in for an item's raw 'category' field, for use in cache keys."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(str(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(str(v) for v in value)
+    return repr(value)
+
+# Screen geometry is fixed for the life of the process; cache it (and the derived
+# PPI) so rebuilding/reconfiguring the kiosk does not round-trip to Tcl each time.
+_SCREEN_SIZE_CACHE = {}
+_PPI_CACHE = {}
+
+
+def _screen_size(root):
+    """Return (width, height) of the screen root is on, queried once per root."""
+    size = _SCREEN_SIZE_CACHE.get(root)
+    if size is None:
+        size = (root.winfo_screenwidth(), root.winfo_screenheight())
+        _SCREEN_SIZE_CACHE[root] = size
+    return size
+
+
+def _compute_ppi(root, diagonal_inches):
+    """Pixels per inch for the current screen and a physical diagonal (default 165.68)."""
+    try:
+        screen_w, screen_h = _screen_size(root)
+    except Exception:
+        return 165.68
+    key = (screen_w, screen_h, diagonal_inches)
+    ppi = _PPI_CACHE.get(key)
+    if ppi is None:
+        diagonal_pixels = (screen_w ** 2 + screen_h ** 2) ** 0.5
+        ppi = diagonal_pixels / diagonal_inches if diagonal_inches > 0 else 165.68
+        _PPI_CACHE[key] = ppi
+    return ppi
+
+
 class KioskFrame(tk.Frame):
     def __init__(self, parent, controller):
         tk.Frame.__init__(self, parent)
@@ -32,18 +220,38 @@ class KioskFrame(tk.Frame):
         self._press_y_root = 0
         self._drag_threshold_px = 8
         self._resize_job = None
-        self.image_cache = {} # To prevent images from being garbage-collected
+        self._pending_num_cols = None
+        self.image_cache = OrderedDict() # (resolved_path, target_h) -> PhotoImage, LRU-bounded
+        self._image_cache_max = int(getattr(controller, 'config', {}).get('image_cache_max_entries', 256))
         self._deferred_image_queue = deque()
         self._deferred_loader_job = None
+        # Card images are decoded/resized on worker threads; only PhotoImage
+        # creation (which must touch Tk) happens in _process_deferred_batch.
+        self._img_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='kiosk-img')
+        self._pending_decodes = {}  # (resolved_path, target_h) -> Future[PIL.Image]
         self._image_path_cache = {}  # raw image path -> resolved absolute path or None
+        self._logo_search_cache = {}  # configured header_logo_path -> resolved logo file
+        self._thumb_cache_dir = os.path.join(get_project_root(), '.thumb_cache')
+        self._thumb_cache_max = int(getattr(controller, 'config', {}).get('thumb_cache_max_files', 512))
+        self._img_pool.submit(self._prune_thumb_cache)
         self._missing_image_paths_logged = set()
         self._last_layout_signature = None
         self._last_num_cols = None
         self._scrollable_frame = None
+        # Viewport virtualization: cards are only built once their row nears the visible area.
+        self._pending_cards = deque()  # (row, col, item_data) not yet built, in row order
+        self._virtual_rows = 0
+        self._virtual_cols = 0
+        self._virtual_row_height = None  # row/column minsize the grid was last configured with
+        self._virtual_col_width = None
+        self._viewport_job = None
+        # Card widget pool: cards are hidden and re-gridded across populates instead of rebuilt.
+        self._card_pool = {}  # _card_key(item) -> card frame
+        self._unpooled_cards = []
+        self._shown_card_keys = set()
         # Tunable: how many images to load per batch and delay between batches (ms)
         self._deferred_batch = int(getattr(controller, 'config', {}).get('deferred_image_batch', 12))
         self._deferred_delay = int(getattr(controller, 'config', {}).get('deferred_image_delay_ms', 20))
-        self._category_cache = {} # Cache for category detection (item_name -> categories)
 
         # --- Color and Font Scheme ---
         # Modern, high-contrast palette for readability on the kiosk display
@@ -57,37 +265,14 @@ class KioskFrame(tk.Frame):
             'disabled_bg': '#f1f3f7',
             'out_of_stock_fg': '#e53935'
         }
-        self.fonts = {
-            'header': tkfont.Font(family="Helvetica", size=24, weight="bold"),
-            'name': tkfont.Font(family="Helvetica", size=17, weight="bold"),
-            'description': tkfont.Font(family="Helvetica", size=12),
-            'price': tkfont.Font(family="Helvetica", size=15, weight="bold"),
-            'quantity': tkfont.Font(family="Helvetica", size=12),
-            'image_placeholder': tkfont.Font(family="Helvetica", size=14),
-            'out_of_stock': tkfont.Font(family="Helvetica", size=14, weight="bold"),
-            'category': tkfont.Font(family="Helvetica", size=9),
-            'control_small': tkfont.Font(family="Helvetica", size=10),
-            'control_bold': tkfont.Font(family="Helvetica", size=10, weight="bold"),
-            'cart_btn': tkfont.Font(family="Helvetica", size=15, weight="bold"),
-        }
+        # Fixed-size fonts are shared across instances; screen-dependent ones are added below.
+        self.fonts = dict(KioskFrame._get_shared_fonts(controller))
         
-        # Category rules are compiled once to keep filtering fast and accurate.
-        self._category_rules = {
-            'Resistor': [r'\bresistor\b', r'\br\d+\b', r'\bohm\b', r'\bkohm\b'],
-            'Capacitor': [r'\bcapacitor\b', r'\bfarad\b', r'\buf\b', r'\bpf\b'],
-            'IC': [r'\bic\d+\b', r'\bintegrated\s*circuit\b', r'\b74(?:ls)?\d+\b', r'\b555\b', r'\blm\d+\b'],
-            'Amplifier': [r'\bamplifier\b', r'\bop[- ]?amp\b'],
-            'Board': [r'\bboard\b', r'\bpcb\b', r'\bbreadboard\b', r'\bshield\b', r'\barduino\b', r'\buno\b'],
-            'Bundle': [r'\bbundle\b', r'\bkit\b', r'\bpack\b', r'\bsolder\b'],
-            'Wires': [r'\bwire(s)?\b', r'\bjumper\b', r'\bcable\b', r'\bcord\b', r'\blead(s)?\b', r'\bawg\b', r'\balligator\b'],
-            'Switches': [r'\bswitch(es)?\b', r'\bpush\s*button(s)?\b', r'\bbutton(s)?\b'],
-            'Semiconductor': [r'\bdiode\b', r'\btransistor\b', r'\bled\b', r'\bregulator\b'],
-            'Sensor': [r'\bsensor\b', r'\bpir\b', r'\bphotodiode\b', r'\bir\b'],
-        }
-        self._compiled_category_rules = {
-            cat: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
-            for cat, patterns in self._category_rules.items()
-        }
+        self._item_categories = {} # (name, raw category field) -> (categories, casefolded frozenset)
+        self._card_text_cache = {} # (name, description, price, category, currency) -> card strings
+        self._filter_index_key = None
+        self._filter_index = {} # casefolded category -> positions in the current source list
+        self._cached_source = None # (source key, items) built by reset_state for the next populate
 
         # Simple notice if change hoppers are empty
         self._change_notice_state = None
@@ -100,33 +285,17 @@ class KioskFrame(tk.Frame):
         except Exception:
             diagonal_inches = 13.3
 
-        # Get current screen pixel dimensions (may already be portrait or landscape depending on system settings)
-        try:
-            screen_w = controller.winfo_screenwidth()
-            screen_h = controller.winfo_screenheight()
-            diagonal_pixels = (screen_w ** 2 + screen_h ** 2) ** 0.5
-            self.ppi = diagonal_pixels / diagonal_inches if diagonal_inches > 0 else 165.68
-        except Exception:
-            # Fallback to a reasonable default PPI
-            self.ppi = 165.68
-        
-        # Detect if running on Raspberry Pi for better card sizing
-        is_pi = platform.machine() in ['armv7l', 'armv6l', 'aarch64']
+        # Current screen pixel dimensions (may already be portrait or landscape depending on system settings)
+        self.ppi = _compute_ppi(controller, diagonal_inches)
         
         # Calculate card dimensions (responsive to screen size)
-        if is_pi:
-            # On Pi 7" touchscreen (1024x600), use smaller cards for 4-5 per row
-            self.card_width = int(self.ppi * 1.5)   # 1.5 inches (optimized for Pi)
-            self.card_height = int(self.ppi * 2.2)  # 2.2 inches (optimized for Pi)
-            self.card_spacing = int(self.ppi * (0.3 / 2.54))  # 0.3cm spacing
-        else:
-            # On larger desktop displays, use standard sizing
-            self.card_width = int(self.ppi * 2.0)   # 2.0 inches
-            self.card_height = int(self.ppi * 3.0)  # 3.0 inches
-            self.card_spacing = int(self.ppi * (0.5 / 2.54))  # 0.5cm spacing
+        width_in, height_in, spacing_in = _CARD_SIZE_INCHES
+        self.card_width = int(self.ppi * width_in)
+        self.card_height = int(self.ppi * height_in)
+        self.card_spacing = int(self.ppi * spacing_in)
 
         # Get screen dimensions for proportional sizing
-        screen_height = controller.winfo_screenheight()
+        screen_height = _screen_size(controller)[1]
         self.header_px = int(screen_height * 0.15)  # 15% of screen height for header
         self.footer_px = int(screen_height * 0.05)  # 5% of screen height for footer
         self.touch_dead_zone_top_px = 100
@@ -148,7 +317,9 @@ class KioskFrame(tk.Frame):
         self.group_members = cfg.get('group_members', [])
 
         self.items = controller.items
+        self._currency = self._resolve_currency_symbol()
         self.configure(bg=self.colors['background'])
+        self._register_card_bindings()
         # Create widgets and expose header/footer widgets so they can be updated
         self.create_widgets()
     
@@ -163,6 +334,29 @@ class KioskFrame(tk.Frame):
             self._deferred_image_queue.clear()
 
 
+    _shared_fonts = None
+    _shared_fonts_root = None
+
+    @classmethod
+    def _get_shared_fonts(cls, root):
+        """Build the fixed-size card/control fonts once per Tk interpreter."""
+        if cls._shared_fonts is None or cls._shared_fonts_root is not root:
+            cls._shared_fonts = {
+                'header': tkfont.Font(root=root, family="Helvetica", size=24, weight="bold"),
+                'name': tkfont.Font(root=root, family="Helvetica", size=17, weight="bold"),
+                'description': tkfont.Font(root=root, family="Helvetica", size=12),
+                'price': tkfont.Font(root=root, family="Helvetica", size=15, weight="bold"),
+                'quantity': tkfont.Font(root=root, family="Helvetica", size=12),
+                'image_placeholder': tkfont.Font(root=root, family="Helvetica", size=14),
+                'out_of_stock': tkfont.Font(root=root, family="Helvetica", size=14, weight="bold"),
+                'category': tkfont.Font(root=root, family="Helvetica", size=9),
+                'control_small': tkfont.Font(root=root, family="Helvetica", size=10),
+                'control_bold': tkfont.Font(root=root, family="Helvetica", size=10, weight="bold"),
+                'cart_btn': tkfont.Font(root=root, family="Helvetica", size=15, weight="bold"),
+            }
+            cls._shared_fonts_root = root
+        return cls._shared_fonts
+
     def on_canvas_press(self, event):
         """Records the starting y-position and fixed x-position of a mouse drag."""
         try:
@@ -287,19 +481,33 @@ class KioskFrame(tk.Frame):
         except Exception:
             pass
 
-    def _bind_wheel_recursive(self, widget):
-        """Bind wheel events to a widget and all descendants for consistent item-hover scrolling."""
-        if widget is None:
-            return
+    ITEM_TAG = 'KioskItem'
+    DRAG_ONLY_TAG = 'KioskItemDragOnly'
+    WHEEL_TAG = 'KioskCardWheel'
+
+    def _register_card_bindings(self):
+        """Register card event handlers once on shared bindtags instead of per widget."""
         try:
-            widget.bind('<MouseWheel>', self._on_mousewheel_kiosk, add='+')
-            widget.bind('<Button-4>', self._on_mousewheel_kiosk, add='+')
-            widget.bind('<Button-5>', self._on_mousewheel_kiosk, add='+')
+            self.bind_class(self.ITEM_TAG, '<ButtonPress-1>', self._on_item_press_tag)
+            self.bind_class(self.ITEM_TAG, '<B1-Motion>', self.on_item_drag)
+            self.bind_class(self.ITEM_TAG, '<ButtonRelease-1>', self.on_item_release)
+            self.bind_class(self.DRAG_ONLY_TAG, '<ButtonPress-1>', self.on_canvas_press)
+            self.bind_class(self.DRAG_ONLY_TAG, '<B1-Motion>', self.on_canvas_drag)
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                self.bind_class(self.WHEEL_TAG, sequence, self._on_mousewheel_kiosk)
         except Exception:
             pass
+
+    def _on_item_press_tag(self, event):
+        """Press handler for ITEM_TAG; the item dict is stashed on the widget."""
+        self.on_item_press(event, getattr(event.widget, '_item_data', None))
+
+    def _prepend_bindtag(self, widget, tag):
+        """Put tag first so its handlers run before class/toplevel/all bindings."""
         try:
-            for child in widget.winfo_children():
-                self._bind_wheel_recursive(child)
+            tags = widget.bindtags()
+            if tag not in tags:
+                widget.bindtags((tag,) + tags)
         except Exception:
             pass
 
@@ -310,6 +518,31 @@ class KioskFrame(tk.Frame):
             return value
         return value[:max(1, max_chars - 3)].rstrip() + "..."
 
+    def _card_texts(self, item_data):
+        """Return (name, category, description, price) card strings, formatted once per item."""
+        name = item_data.get('name', '')
+        description = item_data.get('description', '')
+        price = item_data.get('price', 0)
+        key = (name, description, price, _category_field_key(item_data.get('category')), self._currency)
+        texts = self._card_text_cache.get(key)
+        if texts is None:
+            # Category based on item name keywords
+            item_categories = self._get_categories_for_item(item_data)
+            if item_categories:
+                shown_categories = item_categories[:2]
+                suffix = "..." if len(item_categories) > 2 else ""
+                category_text = f"{', '.join(shown_categories)}{suffix}"
+            else:
+                category_text = 'Misc'
+            texts = (
+                self._truncate_text(name, 48),
+                category_text,
+                self._truncate_text(description, 90),
+                f"{self._currency}{price:.2f}",
+            )
+            self._card_text_cache[key] = texts
+        return texts
+
     def create_item_card(self, parent, item_data):
         """Creates a single item card widget with dimensions: 1in width x 2.5in height."""
         # Determine stock status and color-coding
@@ -318,21 +551,19 @@ class KioskFrame(tk.Frame):
         
         # Determine stock status color
         if quantity <= 0:
-            stock_status = 'out_of_stock'
-            border_color = '#e74c3c'  # Red
-            stock_indicator = 'OUT'
-        elif quantity <= default_threshold:
-            stock_status = 'low_stock'
-            border_color = '#f39c12'  # Orange/Yellow
-            stock_indicator = f'LOW {quantity}'
+            stock_status, border_color, badge_prefix = _STOCK_OUT
+            stock_indicator = badge_prefix
         else:
-            stock_status = 'in_stock'
-            border_color = '#27ae60'  # Green
-            stock_indicator = f'OK {quantity}'
+            stock_status, border_color, badge_prefix = _STOCK_LOW if quantity <= default_threshold else _STOCK_OK
+            stock_indicator = f'{badge_prefix} {quantity}'
         
+        # Out-of-stock cards are built with the disabled background directly
+        # rather than recoloring every child afterwards.
+        card_bg = self.colors['card_bg'] if quantity > 0 else self.colors['disabled_bg']
+
         card = tk.Frame(
             parent,
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             highlightbackground=border_color,  # Color-coded border
             highlightthickness=3,  # Thicker border for visibility
             bd=0,
@@ -341,27 +572,24 @@ class KioskFrame(tk.Frame):
         )
         card.pack_propagate(False)  # Fix the size to 1in x 2.5in
 
-        # Stock Status Badge (top-right corner)
-        badge_frame = tk.Frame(card, bg=border_color, height=20)
-        badge_frame.pack(side='top', fill='x')
-        badge_frame.pack_propagate(False)
-        
+        # Stock Status Badge (top strip); a full-width label needs no wrapper frame.
         badge_label = tk.Label(
-            badge_frame,
+            card,
             text=f'  {stock_indicator}  ',
             font=self.fonts['control_bold'],
             bg=border_color,
-            fg='white'
+            fg='white',
+            pady=1
         )
-        badge_label.pack(expand=True)
+        badge_label.pack(side='top', fill='x')
 
         # Image Placeholder - 60% of card height with minimal padding
         image_height = int(self.card_height * 0.55)  # Reduced to accommodate badge
-        image_frame = tk.Frame(card, bg=self.colors['card_bg'], height=image_height)
+        image_frame = tk.Frame(card, bg=card_bg, height=image_height)
         image_frame.pack(fill='x', padx=2, pady=2)
         image_frame.pack_propagate(False) # Prevents child widgets from resizing it
         
-        image_label = tk.Label(image_frame, bg=self.colors['card_bg'])
+        image_label = tk.Label(image_frame, bg=card_bg)
         image_label.pack(expand=True)
 
         image_path = item_data.get("image")
@@ -369,30 +597,35 @@ class KioskFrame(tk.Frame):
             resolved_path = self._resolve_image_path(image_path)
             
             if resolved_path:
+                try:
+                    # Remember the file version so reset_state can retire this card if it changes.
+                    image_label._image_source = (resolved_path, os.path.getmtime(resolved_path))
+                except OSError:
+                    image_label._image_source = (resolved_path, None)
                 try:
                     # Queue image for deferred loading to avoid blocking UI
                     # If already cached, use it immediately
-                    if resolved_path in self.image_cache:
-                        photo = self.image_cache[resolved_path]
+                    cache_key = (resolved_path, image_height - 8)
+                    photo = self._get_cached_image(cache_key)
+                    if photo is not None:
                         image_label.config(image=photo)
                         image_label.image = photo
                     else:
                         # Store desired target height so loader can resize appropriately
-                        image_label._deferred_image = (resolved_path, image_height - 8)
+                        image_label._deferred_image = cache_key
                         image_label.config(text='')
+                        self._submit_decode(cache_key)
                         # Add to queue and ensure loader is running
-                        self._deferred_image_queue.append(image_label)
-                        if not self._deferred_loader_job:
-                            self._deferred_loader_job = self.after(10, self._process_deferred_batch)
+                        self._queue_deferred_image(image_label)
                 except Exception as e:
-                    print(f"Error loading image {resolved_path}: {e}")
+                    logger.error("Error loading image %s: %s", resolved_path, e)
                     image_label.config(text="Image Error", font=self.fonts['image_placeholder'], fg=self.colors['gray_fg'])
             else:
                 # Show placeholder if image not found
                 normalized = str(image_path).replace('\\', '/')
                 if normalized and normalized not in self._missing_image_paths_logged:
                     self._missing_image_paths_logged.add(normalized)
-                    print(f"[KioskFrame] Image not found: {normalized}")
+                    logger.warning("[KioskFrame] Image not found: %s", normalized)
                 image_label.config(text="No Image", font=self.fonts['image_placeholder'], fg=self.colors['gray_fg'])
         else:
             # Show placeholder if no image
@@ -400,75 +633,61 @@ class KioskFrame(tk.Frame):
 
 
 
-        # Frame for text content - minimal padding
         # Bottom controls: price (left) and qty + stock warning (right) stay pinned at the bottom.
-        bottom_frame = tk.Frame(card, bg=self.colors['card_bg'])
+        bottom_frame = tk.Frame(card, bg=card_bg)
         bottom_frame.pack(side='bottom', fill='x', padx=10, pady=(0, 10))
 
-        text_frame = tk.Frame(card, bg=self.colors['card_bg'])
-        # Let text area grow but cap its content heights so price/stock always visible.
-        text_frame.pack(fill='both', expand=True, padx=2)
+        # Text labels pack straight into the card between image and bottom row;
+        # their line caps keep price/stock always visible.
+        name_text, category_text, description_text, price_text = self._card_texts(item_data)
 
         # 1. Name of item
-        name_text = self._truncate_text(item_data.get('name', ''), 48)
         name_label = tk.Label(
-            text_frame,
+            card,
             text=name_text,
             font=self.fonts['name'],
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             fg=self.colors['text_fg'],
             anchor='w',
             justify='left',
             wraplength=max(160, self.card_width - 22),
             height=2  # cap to 2 lines to avoid pushing price out
         )
-        name_label.pack(fill='x', pady=(6, 2))
+        name_label.pack(fill='x', padx=2, pady=(6, 2))
 
         # 1b. Category based on item name keywords
-        item_categories = self._get_categories_for_item(item_data)
-        if item_categories:
-            shown_categories = item_categories[:2]
-            suffix = "..." if len(item_categories) > 2 else ""
-            category_text = f"{', '.join(shown_categories)}{suffix}"
-        else:
-            category_text = 'Misc'
         category_label = tk.Label(
-            text_frame,
+            card,
             text=f"Category: {category_text}",
             font=self.fonts['category'],
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             fg='#8B7355',
             anchor='w',
             justify='left',
             wraplength=max(110, self.card_width - 22),
             height=2  # limit height so warnings stay visible
         )
-        category_label.pack(fill='x', pady=(0, 2))
+        category_label.pack(fill='x', padx=2, pady=(0, 2))
 
         # 2. Short description
-        description_text = self._truncate_text(item_data.get('description', ''), 90)
         desc_label = tk.Label(
-            text_frame,
+            card,
             text=description_text,
             font=self.fonts['description'],
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             fg=self.colors['gray_fg'],
             wraplength=max(110, self.card_width - 22),
             justify='left',
             anchor='nw',
             height=3  # enforce 3-line cap to keep price/stock in view
         )
-        desc_label.pack(fill='x', pady=(0, 8))
+        desc_label.pack(fill='x', padx=2, pady=(0, 8))
 
-        # Use normalized currency symbol from controller to avoid stale "$" in UI.
-        currency = str(getattr(self.controller, 'currency_symbol', "\u20b1") or "\u20b1").strip()
-        if (not currency) or (currency in {"$", "US$", "USD", "PHP", "Php", "php"}):
-            currency = "\u20b1"
         price_lbl = tk.Label(
             bottom_frame,
-            text=f"{currency}{item_data.get('price',0):.2f}",
+            text=price_text,
             font=self.fonts['price'],
-            bg=self.colors['card_bg'],
+            bg=card_bg,
             fg=self.colors['price_fg']
         )
         price_lbl.pack(side='left')
@@ -476,54 +695,45 @@ class KioskFrame(tk.Frame):
         # Note: Add button removed. Users click item to navigate to detail view where adding happens.
         
         # Add low-stock warning if quantity is low
+        card_widgets = [card, badge_label, image_frame, image_label, bottom_frame,
+                        name_label, category_label, desc_label, price_lbl]
         if 0 < quantity <= default_threshold:
-            warning_frame = tk.Frame(bottom_frame, bg='#fff3cd')
-            warning_frame.pack(side='right', padx=5)
             warning_label = tk.Label(
-                warning_frame,
+                bottom_frame,
                 text=f'Only {quantity} left!',
                 font=self.fonts['control_small'],
                 bg='#fff3cd',
-                fg='#856404'
+                fg='#856404',
+                padx=3,
+                pady=1
             )
-            warning_label.pack(padx=3, pady=1)
+            warning_label.pack(side='right', padx=5)
+            card_widgets.append(warning_label)
 
-        # Bind click/drag behavior for cards that are purchasable
+        # Bind click/drag behavior for cards that are purchasable. Handlers live on
+        # shared bindtags (see _register_card_bindings); widgets only carry the tag.
         if item_data.get('quantity',0) > 0:
-            press_action = lambda e, data=item_data: self.on_item_press(e, data)
             # Bind only to parts of the card that should navigate on click; skip controls (spinbox/add button)
-            widgets_to_bind = [card, image_frame, image_label, text_frame, name_label, desc_label, price_lbl]
+            widgets_to_bind = [card, image_frame, image_label, name_label, desc_label, price_lbl]
             for w in widgets_to_bind:
-                try:
-                    w.bind("<ButtonPress-1>", press_action)
-                    w.bind("<B1-Motion>", self.on_item_drag)
-                    w.bind("<ButtonRelease-1>", self.on_item_release)
-                except Exception:
-                    pass
+                w._item_data = item_data
+                self._prepend_bindtag(w, self.ITEM_TAG)
         else:
-            disabled_bg = self.colors['disabled_bg']
-            card.config(bg=disabled_bg)
-            for widget in card.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    widget.config(bg=disabled_bg)
-                    for child in widget.winfo_children():
-                        try:
-                            child.config(bg=disabled_bg)
-                        except Exception:
-                            pass
             # Place out-of-stock label on the right where controls were, to avoid overlapping price
-            out_lbl = tk.Label(bottom_frame, text="Out of Stock", font=self.fonts['out_of_stock'], bg=disabled_bg, fg=self.colors['out_of_stock_fg'])
+            out_lbl = tk.Label(bottom_frame, text="Out of Stock", font=self.fonts['out_of_stock'], bg=card_bg, fg=self.colors['out_of_stock_fg'])
             out_lbl.pack(side='right')
-            drag_only_widgets = [card, image_frame, image_label, text_frame, name_label, desc_label, price_lbl, out_lbl]
+            card_widgets.append(out_lbl)
+            drag_only_widgets = [card, image_frame, image_label, name_label, desc_label, price_lbl, out_lbl]
             for w in drag_only_widgets:
-                try:
-                    w.bind("<ButtonPress-1>", self.on_canvas_press)
-                    w.bind("<B1-Motion>", self.on_canvas_drag)
-                except Exception:
-                    pass
+                self._prepend_bindtag(w, self.DRAG_ONLY_TAG)
 
         # Ensure wheel scroll works even while cursor is directly on card widgets.
-        self._bind_wheel_recursive(card)
+        for w in card_widgets:
+            self._prepend_bindtag(w, self.WHEEL_TAG)
+
+        # Kept so a pooled card can be re-pointed at a fresh item dict (see _reuse_card).
+        card._item_widgets = widgets_to_bind if item_data.get('quantity',0) > 0 else []
+        card._image_label = image_label
 
         return card
 
@@ -616,7 +826,7 @@ class KioskFrame(tk.Frame):
         content.pack(fill='both', expand=True)
         
         # Left sidebar
-        sidebar_width = max(250, int(self.controller.winfo_screenwidth() * 0.22))
+        sidebar_width = max(250, int(_screen_size(self.controller)[0] * 0.22))
         self._category_button_wraplength = max(120, sidebar_width - 32)
         sidebar = tk.Frame(content, width=sidebar_width, bg='#f7fafc')
         sidebar.pack(side='left', fill='y', padx=(12,6), pady=12)
@@ -633,38 +843,8 @@ class KioskFrame(tk.Frame):
         self._category_buttons = {}
         self._active_category = 'All Components'
         
-        def build_categories():
-            """Build category list from assigned items using auto-detected keywords."""
-            categories = set(['All Components'])
-            assigned = getattr(self.controller, 'assigned_slots', None)
-            
-            # If we have assigned items, extract categories from them
-            if isinstance(assigned, list) and any(assigned):
-                term_idx = getattr(self.controller, 'assigned_term', 0) or 0
-                for slot in assigned:
-                    try:
-                        if not slot or not isinstance(slot, dict):
-                            continue
-                        terms = slot.get('terms', [])
-                        if len(terms) > term_idx and terms[term_idx]:
-                            item = terms[term_idx]
-                            item_cats = self._get_categories_for_item(item)
-                            categories.update(item_cats)
-                    except Exception:
-                        continue
-            else:
-                # No assigned items, use default categories from item names if any
-                for item in self.controller.items:
-                    try:
-                        item_cats = self._get_categories_for_item(item)
-                        categories.update(item_cats)
-                    except Exception:
-                        continue
-            
-            return ['All Components'] + sorted([c for c in categories if c != 'All Components'])
-        
         # Initial population
-        categories = build_categories()
+        categories = self._build_category_list()
         
         for cat in categories:
             b = tk.Button(
@@ -707,6 +887,8 @@ class KioskFrame(tk.Frame):
         scrollable_frame.bind('<Configure>', lambda e: self.canvas.configure(scrollregion=self.canvas.bbox('all')))
         self.canvas_window = self.canvas.create_window((0,0), window=scrollable_frame, anchor='nw')
         self.canvas.pack(fill='both', expand=True)
+        # Tk reports every view change (drag, wheel, resize) here; build cards as rows come into view.
+        self.canvas.configure(yscrollcommand=self._on_canvas_yview)
         self.canvas.bind('<ButtonPress-1>', self.on_canvas_press)
         self.canvas.bind('<B1-Motion>', self.on_canvas_drag)
 
@@ -754,49 +936,6 @@ class KioskFrame(tk.Frame):
 
         # Note: Developer names are now shown in system status panel only (no redundant footer)
 
-    def _load_header_logo(self):
-        """Attempt to load the header logo image (if configured) and resize it to fit header height."""
-        self.logo_image = None
-        logo_path = getattr(self, 'header_logo_path', '')
-        if logo_path and os.path.exists(logo_path):
-            try:
-                img = Image.open(logo_path)
-                # Target height slightly smaller than header to allow padding
-                target_h = max(1, self.header_px - 12)
-                h_percent = (target_h / float(img.size[1]))
-                w_size = int((float(img.size[0]) * float(h_percent)))
-                img = img.resize((w_size, target_h), Image.Resampling.LANCZOS)
-                self.logo_image = pil_to_photoimage(img)
-                self.logo_label.config(image=self.logo_image, text='')
-            except Exception as e:
-                print(f"Error loading header logo {logo_path}: {e}")
-                # Fall back to textual placeholder
-                self.logo_label.config(image='', text=self.machine_name if self.machine_name else 'RAON', font=self.fonts['logo_placeholder'], fg=self.colors['text_fg'], bg=self.colors['background'], relief='groove', bd=1, padx=6, pady=4)
-        else:
-            # No logo; show a concise textual placeholder (initials) to avoid
-            # repeating the full machine name in the header.
-            name = self.machine_name or 'RAON'
-            # Build initials from words in the name (max 4 chars)
-            initials = ''.join([p[0].upper() for p in name.split() if p])[:4]
-            # If initials would be too short (single char) and the name is short,
-            # use up to the first 4 characters of the name instead for clarity.
-            if len(initials) == 1 and len(name) <= 4:
-                placeholder_text = name.upper()[:4]
-            else:
-                placeholder_text = initials
-
-            self.logo_label.config(
-                image='',
-                text=placeholder_text,
-                font=self.fonts['logo_placeholder'],
-                fg=self.colors['text_fg'],
-                bg=self.colors['background'],
-                relief='groove',
-                bd=1,
-                padx=6,
-                pady=4,
-            )
-
     def _update_change_notice(self):
         """Show 'exact amount' notice if either change hopper is empty."""
         label = getattr(self, 'change_notice_label', None)
@@ -835,10 +974,7 @@ class KioskFrame(tk.Frame):
         # Recompute PPI and pixel heights if diagonal changed
         diagonal_inches = cfg.get('display_diagonal_inches', 13.3)
         try:
-            screen_w = self.controller.winfo_screenwidth()
-            screen_h = self.controller.winfo_screenheight()
-            diagonal_pixels = (screen_w ** 2 + screen_h ** 2) ** 0.5
-            ppi = diagonal_pixels / float(diagonal_inches) if float(diagonal_inches) > 0 else 165.68
+            ppi = _compute_ppi(self.controller, float(diagonal_inches))
         except Exception:
             ppi = 165.68
 
@@ -860,7 +996,7 @@ class KioskFrame(tk.Frame):
         # Resize header/footer frames
         self.header.config(height=self.header_px)
         self.footer.config(height=self.footer_px)
-        self._load_header_logo()
+        self.load_header_logo()
         # Update footer members text
         members = cfg.get('group_members', [])
         if isinstance(members, list):
@@ -874,15 +1010,35 @@ class KioskFrame(tk.Frame):
         On window resize, checks if the width has changed enough to warrant
         rebuilding the item grid.
         """
+        width = int(getattr(event, 'width', 0) or 0)
+        # <Configure> also fires for moves/height-only changes; width is all that matters here.
+        if width == self._last_canvas_width:
+            return
+        self._last_canvas_width = width
+
+        # Widths are quantized to a column count; only a change of count rebuilds.
+        new_cols = self._compute_num_cols(width)
+        if self._resize_job and new_cols == self._pending_num_cols:
+            # A rebuild for this column count is already queued; it reads the
+            # live canvas width when it runs, so there is nothing to reschedule.
+            return
+
         # Cancel any pending resize job to avoid multiple executions
         if self._resize_job:
-            self.after_cancel(self._resize_job)
+            try:
+                self.after_cancel(self._resize_job)
+            except Exception:
+                pass
+            self._resize_job = None
 
-        # Rebuild only when column count would actually change.
-        new_cols = self._compute_num_cols(int(getattr(event, 'width', 0) or 0))
         if new_cols != self._last_num_cols:
-            self._resize_job = self.after(80, self.populate_items)
-        self._last_canvas_width = int(getattr(event, 'width', 0) or 0)
+            self._pending_num_cols = new_cols
+            self._resize_job = self.after(80, self._run_resize_job)
+
+    def _run_resize_job(self):
+        """Debounced trailing edge of on_resize."""
+        self._resize_job = None
+        self.populate_items()
 
     def filter_by_category(self, event=None):
         """Filter items based on selected category."""
@@ -894,22 +1050,9 @@ class KioskFrame(tk.Frame):
         if not text:
             return None
 
-        normalize_rules = [
-            ("Resistor", ("resistor", "ohm")),
-            ("Capacitor", ("capacitor", "farad", "uf", "pf")),
-            ("IC", ("integrated circuit", "logic ic")),
-            ("Amplifier", ("amplifier", "opamp", "op-amp")),
-            ("Board", ("board", "pcb", "breadboard", "arduino", "uno", "shield")),
-            ("Bundle", ("bundle", "kit", "pack", "solder")),
-            ("Wires", ("wire", "jumper", "cable", "cord", "lead", "awg", "alligator")),
-            ("Switches", ("switch", "button", "push button")),
-            ("Semiconductor", ("diode", "transistor", "led", "regulator")),
-            ("Sensor", ("sensor", "pir", "photodiode", "ir")),
-        ]
-        for normalized, keywords in normalize_rules:
-            for keyword in keywords:
-                if keyword in text:
-                    return normalized
+        normalized = _match_normalized_category(text)
+        if normalized:
+            return normalized
 
         if allow_passthrough:
             cleaned = re.sub(r"\s+", " ", text).strip()
@@ -917,7 +1060,81 @@ class KioskFrame(tk.Frame):
                 return cleaned.title()
         return None
 
+    def _source_key(self):
+        """Identity of the current item source (assigned slots + published term, or catalog)."""
+        return (
+            id(getattr(self.controller, 'assigned_slots', None)),
+            getattr(self.controller, 'assigned_term', 0) or 0,
+            id(self.controller.items),
+        )
+
+    def _collect_source_items(self):
+        """Return the items to display: the published term of the assigned slots, else the catalog."""
+        # Decide source of items: use assigned slots if present, otherwise master list
+        assigned = getattr(self.controller, 'assigned_slots', None)
+        source_items = None
+        # Handle two possible shapes: old list-of-item-dicts, or new list-of-slot-wrappers with 'terms'
+        if isinstance(assigned, list) and any(assigned):
+            first = assigned[0]
+            if isinstance(first, dict) and 'terms' in first:
+                # It's the per-slot wrapper format; extract current term index published by admin
+                term_idx = getattr(self.controller, 'assigned_term', 0) or 0
+                try:
+                    extracted = [
+                        dict(terms[term_idx], _slot_number=idx + 1)
+                        for idx, slot in enumerate(assigned)
+                        if slot and isinstance(slot, dict)
+                        for terms in (slot.get('terms'),)
+                        if isinstance(terms, list) and len(terms) > term_idx and isinstance(terms[term_idx], dict) and terms[term_idx]
+                    ]
+                except Exception:
+                    extracted = []
+                if extracted:
+                    source_items = extracted
+            else:
+                # assume old-style list of item dicts
+                source_items = [
+                    {'_slot_number': idx + 1, **slot}
+                    for idx, slot in enumerate(assigned)
+                    if slot and isinstance(slot, dict)
+                ]
+
+        if source_items is None:
+            source_items = list(self.controller.items)
+        return source_items
+
+    def _build_category_list(self, source_items=None):
+        """Build the sidebar category list ("All Components" first) as a union of per-item categories."""
+        if source_items is None:
+            source_items = self._collect_source_items()
+        categories = set().union(*(self._get_categories_for_item(item) for item in source_items))
+        categories.discard('All Components')
+        return ['All Components'] + sorted(categories)
+
     def _get_categories_for_item(self, item):
+        """Resolve categories for an item, memoized per (name, category field) until reset_state."""
+        return self._item_category_entry(item)[0]
+
+    def _get_category_keys_for_item(self, item):
+        """Casefolded categories of an item as a frozenset, for filter membership tests."""
+        return self._item_category_entry(item)[1]
+
+    def _item_category_entry(self, item):
+        if isinstance(item, dict):
+            key = (item.get("name", ""), _category_field_key(item.get("category")))
+        else:
+            key = (str(item or ""), None)
+        entry = self._item_categories.get(key)
+        if entry is None:
+            try:
+                categories = tuple(self._resolve_categories_for_item(item))
+            except Exception:
+                categories = ()
+            entry = (categories, frozenset(c.casefold() for c in categories))
+            self._item_categories[key] = entry
+        return entry
+
+    def _resolve_categories_for_item(self, item):
         """Resolve categories for an item dict, preferring explicit category fields."""
         if isinstance(item, dict):
             explicit = item.get("category")
@@ -941,44 +1158,7 @@ class KioskFrame(tk.Frame):
 
     def _get_categories_from_item_name(self, item_name):
         """Extract categories from an item name using normalized regex rules."""
-        normalized_name = str(item_name or "").strip()
-        cache_key = normalized_name.lower()
-        if cache_key in self._category_cache:
-            return self._category_cache[cache_key]
-
-        if not normalized_name:
-            result = ["Misc"]
-            self._category_cache[cache_key] = result
-            return result
-
-        categories = set()
-        searchable_parts = [normalized_name]
-
-        # Capture meaningful chunks from "CODE - CATEGORY - DETAILS" style names.
-        for part in [p.strip() for p in normalized_name.split(" - ") if p.strip()]:
-            searchable_parts.append(part)
-
-        # Tokenized fallback chunks for names with slashes/parentheses/commas.
-        for token in re.split(r"[/(),]", normalized_name):
-            token = token.strip()
-            if token:
-                searchable_parts.append(token)
-
-        for text in searchable_parts:
-            normalized_text = text.lower()
-            normalized_cat = self._normalize_category_name(normalized_text)
-            if normalized_cat:
-                categories.add(normalized_cat)
-
-            for cat, patterns in self._compiled_category_rules.items():
-                for pattern in patterns:
-                    if pattern.search(normalized_text):
-                        categories.add(cat)
-                        break
-
-        result = sorted(categories) if categories else ["Misc"]
-        self._category_cache[cache_key] = result
-        return result
+        return list(_classify_item_name(str(item_name or "").strip().lower()))
 
     def populate_items(self):
         """Clears and repopulates the scrollable frame with item cards."""
@@ -988,61 +1168,25 @@ class KioskFrame(tk.Frame):
 
         num_cols = self._compute_num_cols(self.canvas.winfo_width())
         self._last_num_cols = num_cols
+        self._currency = self._resolve_currency_symbol()
 
-        # Decide source of items: use assigned slots if present, otherwise master list
-        assigned = getattr(self.controller, 'assigned_slots', None)
-        source_items = None
-        # Handle two possible shapes: old list-of-item-dicts, or new list-of-slot-wrappers with 'terms'
-        if isinstance(assigned, list) and any(assigned):
-            first = assigned[0]
-            if isinstance(first, dict) and 'terms' in first:
-                # It's the per-slot wrapper format; extract current term index published by admin
-                term_idx = getattr(self.controller, 'assigned_term', 0) or 0
-                extracted = []
-                for idx, slot in enumerate(assigned):
-                    try:
-                        if not slot or not isinstance(slot, dict):
-                            continue
-                        terms = slot.get('terms', [])
-                        if len(terms) > term_idx and terms[term_idx]:
-                            item_data = dict(terms[term_idx])
-                            item_data['_slot_number'] = idx + 1
-                            extracted.append(item_data)
-                    except Exception:
-                        continue
-                if extracted:
-                    source_items = extracted
-            else:
-                # assume old-style list of item dicts
-                source_items = []
-                for idx, slot in enumerate(assigned):
-                    if not slot or not isinstance(slot, dict):
-                        continue
-                    item_data = dict(slot)
-                    item_data.setdefault('_slot_number', idx + 1)
-                    source_items.append(item_data)
-
-        if source_items is None:
-            source_items = list(self.controller.items)
+        # reset_state hands over the list it just built categories from; otherwise extract afresh,
+        # since quantities and assignments may have changed in place since the last pass.
+        cached, self._cached_source = self._cached_source, None
+        if cached is not None and cached[0] == self._source_key():
+            source_items = cached[1]
+        else:
+            source_items = self._collect_source_items()
 
         # Filter items by selected category based on item name keywords
         selected_category = getattr(self, '_active_category', 'All Components')
-        filtered_items = []
-        
-        for item in source_items:
-            # Get categories for this item based on name keywords
-            item_categories = self._get_categories_for_item(item)
-            
-            # Check if item matches selected category
-            sel_cat = (selected_category or '').strip().lower()
-            if sel_cat in ['all components', 'all categories']:
-                filtered_items.append(item)
-            else:
-                # Check if item's categories include the selected one (case-insensitive)
-                for item_cat in item_categories:
-                    if item_cat.lower() == sel_cat:
-                        filtered_items.append(item)
-                        break
+        sel_cat = (selected_category or '').strip().casefold()
+        if sel_cat in ('all components', 'all categories'):
+            filtered_items = source_items
+        else:
+            # Case-insensitive category -> item positions, rebuilt only when the source list changes.
+            filter_index = self._get_filter_index(source_items)
+            filtered_items = [source_items[i] for i in filter_index.get(sel_cat, ())]
 
         # Skip expensive rebuild if visual layout is effectively unchanged.
         layout_signature = self._build_items_layout_signature(filtered_items, selected_category, num_cols)
@@ -1058,28 +1202,167 @@ class KioskFrame(tk.Frame):
                 pass
             self._deferred_loader_job = None
         self._deferred_image_queue.clear()
-        for widget in scrollable_frame.winfo_children():
-            widget.destroy()
+        self._prune_pending_decodes()
+        self._pending_cards.clear()
+        # Hide pooled cards that may be shown again; destroy ones whose item is gone or changed.
+        live_keys = {self._card_key(item) for item in source_items}
+        for key, card in list(self._card_pool.items()):
+            if key in live_keys:
+                card.grid_forget()
+            else:
+                card.destroy()
+                del self._card_pool[key]
+        for card in self._unpooled_cards:
+            card.destroy()
+        self._unpooled_cards = []
+        self._shown_card_keys = set()
 
         # Repopulate grid with filtered item cards (4 columns)
         max_cols = num_cols
         
-        # Configure grid columns to expand evenly
-        for col in range(max_cols):
-            scrollable_frame.grid_columnconfigure(col, weight=1)
+        # Configure grid columns to expand evenly. Cards have a fixed size, so
+        # a column minsize lets grid settle column widths once instead of
+        # renegotiating as cards are added; columns left over from a wider grid collapse.
+        # Only columns whose state changes are reconfigured; each call is a Tcl round-trip.
+        col_width = self.card_width + 2 * (self.card_spacing // 2)
+        first_col = 0 if col_width != self._virtual_col_width else min(max_cols, self._virtual_cols)
+        for col in range(first_col, max(max_cols, self._virtual_cols)):
+            if col < max_cols:
+                scrollable_frame.grid_columnconfigure(col, weight=1, minsize=col_width)
+            else:
+                scrollable_frame.grid_columnconfigure(col, weight=0, minsize=0)
+        self._virtual_cols = max_cols
+        self._virtual_col_width = col_width
         
-        for i, item in enumerate(filtered_items):
-            row = i // max_cols
-            col = i % max_cols
-            card = self.create_item_card(scrollable_frame, item)
-            # Use calculated 5cm spacing between cards
-            spacing_half = self.card_spacing // 2
-            card.grid(row=row, column=col, padx=spacing_half, pady=spacing_half, sticky="nsew")
+        # Reserve the full grid height up front so the scroll region is correct
+        # before off-screen cards exist; rows left over from a larger grid collapse.
+        row_height = self._card_row_height()
+        num_rows = (len(filtered_items) + max_cols - 1) // max_cols
+        first_row = 0 if row_height != self._virtual_row_height else min(num_rows, self._virtual_rows)
+        for row in range(first_row, max(num_rows, self._virtual_rows)):
+            scrollable_frame.grid_rowconfigure(row, minsize=row_height if row < num_rows else 0)
+        self._virtual_rows = num_rows
+        self._virtual_row_height = row_height
+
+        self._pending_cards.extend((i // max_cols, i % max_cols, item) for i, item in enumerate(filtered_items))
+        self._build_visible_cards()
         
         # Schedule center_frame to run after the layout has been updated
         # This ensures we get the correct width for the scrollable_frame
         self.after(10, self.center_frame)
 
+    def _get_filter_index(self, source_items):
+        """Return {casefolded category: positions in source_items}, cached per source list."""
+        key = self._source_key() + (tuple([item.get('name', '') for item in source_items]),)
+        if key != self._filter_index_key:
+            index = {}
+            for pos, item in enumerate(source_items):
+                for cat in self._get_category_keys_for_item(item):
+                    index.setdefault(cat, []).append(pos)
+            self._filter_index = index
+            self._filter_index_key = key
+        return self._filter_index
+
+    def _resolve_currency_symbol(self):
+        """Use normalized currency symbol from controller to avoid stale "$" in UI."""
+        currency = str(getattr(self.controller, 'currency_symbol', "\u20b1") or "\u20b1").strip()
+        if (not currency) or (currency in {"$", "US$", "USD", "PHP", "Php", "php"}):
+            currency = "\u20b1"
+        return currency
+
+    def _card_row_height(self):
+        """Pixel height of one grid row: card plus the spacing above and below it."""
+        return max(1, self.card_height + 2 * (self.card_spacing // 2))
+
+    def _on_canvas_yview(self, first, last):
+        """yscrollcommand hook: coalesce view changes into one idle viewport refresh."""
+        if self._pending_cards and not self._viewport_job:
+            try:
+                self._viewport_job = self.after_idle(self._build_visible_cards)
+            except Exception:
+                self._viewport_job = None
+
+    def _build_visible_cards(self):
+        """Create pending cards whose rows are visible or within one screen below the viewport."""
+        self._viewport_job = None
+        scrollable_frame = self._scrollable_frame
+        if scrollable_frame is None or not self._pending_cards:
+            return
+        row_height = self._card_row_height()
+        try:
+            canvas_h = max(1, self.canvas.winfo_height())
+            view_bottom = self.canvas.canvasy(canvas_h)
+        except Exception:
+            canvas_h, view_bottom = 1, 1
+        # Build one extra screen of rows so a quick drag does not reveal empty slots.
+        last_row = int(view_bottom // row_height) + canvas_h // row_height + 1
+
+        spacing_half = self.card_spacing // 2
+        while self._pending_cards and self._pending_cards[0][0] <= last_row:
+            row, col, item = self._pending_cards.popleft()
+            key = self._card_key(item)
+            card = self._card_pool.get(key)
+            if key in self._shown_card_keys:
+                # Same content twice in one grid: a widget can only be gridded once.
+                card = self.create_item_card(scrollable_frame, item)
+                self._unpooled_cards.append(card)
+            elif card is not None:
+                self._reuse_card(card, item)
+            else:
+                card = self.create_item_card(scrollable_frame, item)
+                self._card_pool[key] = card
+            self._shown_card_keys.add(key)
+            # Use calculated 5cm spacing between cards
+            card.grid(row=row, column=col, padx=spacing_half, pady=spacing_half, sticky="nsew")
+
+    def _card_key(self, item):
+        """Everything a card renders (plus its slot), so equal keys can share one card widget."""
+        return (
+            item.get('_slot_number'),
+            item.get('name', ''),
+            item.get('description', ''),
+            item.get('price', 0),
+            item.get('quantity', 0),
+            item.get('low_stock_threshold', 3),
+            item.get('image'),
+            _category_field_key(item.get('category')),
+            self._currency,
+        )
+
+    def _reuse_card(self, card, item):
+        """Point a pooled card at a fresh item dict and resume its image load if unfinished."""
+        for w in getattr(card, '_item_widgets', ()):
+            w._item_data = item
+        image_label = getattr(card, '_image_label', None)
+        if image_label is not None and getattr(image_label, '_deferred_image', None) and getattr(image_label, 'image', None) is None:
+            self._queue_deferred_image(image_label)
+
+    def _drop_stale_pooled_cards(self):
+        """Destroy pooled cards whose image never loaded or whose image file has since changed."""
+        for key, card in list(self._card_pool.items()):
+            if not key[6]:
+                continue  # item has no image configured; the placeholder is current
+            image_label = getattr(card, '_image_label', None)
+            stale = getattr(image_label, 'image', None) is None
+            source = getattr(image_label, '_image_source', None)
+            if not stale and source:
+                try:
+                    stale = os.path.getmtime(source[0]) != source[1]
+                except OSError:
+                    stale = True
+                if stale:
+                    for cache_key in [k for k in self.image_cache if k[0] == source[0]]:
+                        del self.image_cache[cache_key]
+            if stale:
+                card.destroy()
+                del self._card_pool[key]
+
+    def _queue_deferred_image(self, image_label):
+        """Add a label to the deferred image queue and ensure the loader is running."""
+        self._deferred_image_queue.append(image_label)
+        if not self._deferred_loader_job:
+            self._deferred_loader_job = self.after(10, self._process_deferred_batch)
+
     def center_frame(self, event=None):
         """Callback function to center the scrollable frame inside the canvas."""
         scrollable_frame = self._scrollable_frame
@@ -1100,11 +1383,16 @@ class KioskFrame(tk.Frame):
 
     def reset_state(self):
         """Resets the kiosk screen to its initial state."""
-        # Clear category cache since item list may have changed
-        self._category_cache = {}
         self._last_layout_signature = None
-        self._image_path_cache = {}
+        self._item_categories = {}
+        self._card_text_cache = {}
+        self._filter_index_key = None
+        self._filter_index = {}
+        # Keep resolved image paths across resets; only re-check misses, since
+        # admin changes may have added the file since the last lookup.
+        self._image_path_cache = {raw: path for raw, path in self._image_path_cache.items() if path}
         self._missing_image_paths_logged = set()
+        self._drop_stale_pooled_cards()
         
         # Rebuild category buttons from assigned items (fresh list after admin changes)
         try:
@@ -1116,34 +1404,11 @@ class KioskFrame(tk.Frame):
                     pass
             self._category_buttons = {}
             
-            # Rebuild categories list dynamically from item names using keywords
-            categories = set(['All Components'])
-            assigned = getattr(self.controller, 'assigned_slots', None)
-            
-            if isinstance(assigned, list) and any(assigned):
-                term_idx = getattr(self.controller, 'assigned_term', 0) or 0
-                for slot in assigned:
-                    try:
-                        if not slot or not isinstance(slot, dict):
-                            continue
-                        terms = slot.get('terms', [])
-                        if len(terms) > term_idx and terms[term_idx]:
-                            item = terms[term_idx]
-                            item_cats = self._get_categories_for_item(item)
-                            categories.update(item_cats)
-                    except Exception:
-                        continue
-            else:
-                # No assigned items, use default categories from item names if any
-                for item in self.controller.items:
-                    try:
-                        item_cats = self._get_categories_for_item(item)
-                        categories.update(item_cats)
-                    except Exception:
-                        continue
-            
-            # Sort categories (keep "All Components" first)
-            cat_list = ['All Components'] + sorted([c for c in categories if c != 'All Components'])
+            # Rebuild categories list dynamically from item names using keywords.
+            # The extracted items are handed to the populate_items call below.
+            source_items = self._collect_source_items()
+            self._cached_source = (self._source_key(), source_items)
+            cat_list = self._build_category_list(source_items)
             
             # Rebuild category buttons
             for cat in cat_list:
@@ -1173,7 +1438,7 @@ class KioskFrame(tk.Frame):
             self._set_active_category_button('All Components')
             
         except Exception as e:
-            print(f"[KioskFrame] Error rebuilding categories: {e}")
+            logger.error("[KioskFrame] Error rebuilding categories: %s", e)
 
         self.populate_items()
 
@@ -1211,26 +1476,20 @@ class KioskFrame(tk.Frame):
         """Load and display header logo image from config path."""
         try:
             logo_path = self.header_logo_path.strip() if self.header_logo_path else ''
-            resolved_logo = None
-            
-            # Try config path first
-            if logo_path:
-                resolved_logo = get_absolute_path(logo_path)
-                if not os.path.exists(resolved_logo):
-                    # Try without path resolution in case it's absolute
-                    if os.path.exists(logo_path):
-                        resolved_logo = logo_path
-                    else:
-                        resolved_logo = None
-            
-            # If config path didn't work, search for common logo filenames
-            if not resolved_logo:
-                common_names = ['LOGO.png', 'logo.png', 'Logo.png', 'LOGO.jpg', 'logo.jpg']
-                for fname in common_names:
-                    test_path = get_absolute_path(fname)
-                    if os.path.exists(test_path):
-                        resolved_logo = test_path
-                        break
+            resolved_logo = self._logo_search_cache.get(logo_path)
+            logo_mtime = None
+            if resolved_logo is not None:
+                try:
+                    logo_mtime = os.path.getmtime(resolved_logo)
+                except OSError:
+                    # The remembered logo was moved or deleted; search again.
+                    del self._logo_search_cache[logo_path]
+                    resolved_logo = None
+            if resolved_logo is None:
+                resolved_logo = self._find_header_logo(logo_path)
+                if resolved_logo:
+                    self._logo_search_cache[logo_path] = resolved_logo
+                    logo_mtime = os.path.getmtime(resolved_logo)
             
             # If still not found, show placeholder
             if not resolved_logo:
@@ -1239,75 +1498,210 @@ class KioskFrame(tk.Frame):
                                             fg='white', bg='#2222a8')
                 return
             
-            # Check cache first
-            if resolved_logo in self.image_cache:
-                photo = self.image_cache[resolved_logo]
+            max_width = 160
+            max_height = int(self.header_px * 0.85)
+
+            # Check cache first; mtime in the key picks up a replaced logo file
+            cache_key = (resolved_logo, logo_mtime, max_width, max_height)
+            photo = self._get_cached_image(cache_key)
+            if photo is not None:
                 self.logo_image_label.config(image=photo, text='')
                 return
             
             # Load and resize image
             img = Image.open(resolved_logo)
-            max_width = 160
-            max_height = int(self.header_px * 0.85)
             img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
             
             # Convert to PhotoImage and display
             photo = pil_to_photoimage(img)
-            self.image_cache[resolved_logo] = photo
+            self._put_cached_image(cache_key, photo)
             self.logo_image_label.config(image=photo, text='')
         except Exception as e:
             # On error, show placeholder
-            print(f"[KioskFrame] Failed to load logo: {e}")
+            logger.warning("[KioskFrame] Failed to load logo: %s", e)
             placeholder_text = (self.machine_name[:1] if self.machine_name else 'R').upper()
             self.logo_image_label.config(text=placeholder_text, font=self.fonts['logo_placeholder'],
                                         fg='white', bg='#2222a8')
 
+    def _find_header_logo(self, logo_path):
+        """Resolve the configured logo path, falling back to common logo filenames."""
+        # Try config path first
+        if logo_path:
+            resolved_logo = get_absolute_path(logo_path)
+            if os.path.exists(resolved_logo):
+                return resolved_logo
+            # Try without path resolution in case it's absolute
+            if os.path.exists(logo_path):
+                return logo_path
+
+        # If config path didn't work, search for common logo filenames
+        common_names = ['LOGO.png', 'logo.png', 'Logo.png', 'LOGO.jpg', 'logo.jpg']
+        for fname in common_names:
+            test_path = get_absolute_path(fname)
+            if os.path.exists(test_path):
+                return test_path
+        return None
+
     def _process_deferred_batch(self):
         """Process a batch of deferred image loads to avoid blocking the UI."""
         try:
             count = 0
+            still_decoding = deque()
             while self._deferred_image_queue and count < max(1, self._deferred_batch):
                 image_label = self._deferred_image_queue.popleft()
                 try:
                     info = getattr(image_label, '_deferred_image', None)
                     if not info:
                         continue
-                    resolved_path, target_h = info
-                    if resolved_path in self.image_cache:
-                        photo = self.image_cache[resolved_path]
+                    photo = self._get_cached_image(info)
+                    if photo is not None:
+                        self._pending_decodes.pop(info, None)
                         image_label.config(image=photo)
                         image_label.image = photo
                         continue
 
-                    img = Image.open(resolved_path)
-                    # Resize to target height while keeping aspect ratio
-                    h_percent = (target_h / float(img.size[1])) if img.size[1] else 1.0
-                    w_size = int((float(img.size[0]) * float(h_percent)))
-                    if w_size < 1:
-                        w_size = 1
-                    if target_h < 1:
-                        target_h = 1
-                    img = img.resize((w_size, target_h), Image.Resampling.LANCZOS)
+                    future = self._pending_decodes.get(info) or self._submit_decode(info)
+                    if not future.done():
+                        still_decoding.append(image_label)
+                        continue
+                    self._pending_decodes.pop(info, None)
+                    img = future.result()
                     photo = pil_to_photoimage(img)
                     # Cache and set on label
-                    self.image_cache[resolved_path] = photo
+                    self._put_cached_image(info, photo)
                     image_label.config(image=photo)
                     image_label.image = photo
                 except Exception:
                     try:
+                        # Do not retry a broken image when a pooled card is shown again.
+                        image_label._deferred_image = None
                         image_label.config(text='No Image', font=self.fonts['image_placeholder'], fg=self.colors['gray_fg'])
                     except Exception:
                         pass
                 count += 1
+            # Labels whose decode is still running keep their place at the front.
+            self._deferred_image_queue.extendleft(reversed(still_decoding))
 
             # Schedule next batch if queue not empty
             if self._deferred_image_queue:
                 self._deferred_loader_job = self.after(self._deferred_delay, self._process_deferred_batch)
             else:
                 self._deferred_loader_job = None
+                self._prune_pending_decodes()
         except Exception:
             self._deferred_loader_job = None
 
+    def _submit_decode(self, key):
+        """Start decoding (resolved_path, target_h) on the worker pool unless already in flight."""
+        future = self._pending_decodes.get(key)
+        if future is None:
+            future = self._img_pool.submit(self._load_card_thumbnail, *key)
+            self._pending_decodes[key] = future
+        return future
+
+    def _prune_pending_decodes(self):
+        """Forget decodes no queued label is waiting on, cancelling those not yet started.
+
+        Running decodes stay so a re-queued card can still collect them; they are
+        dropped by the next prune once finished.
+        """
+        for key, future in list(self._pending_decodes.items()):
+            if future.cancel() or future.done():
+                del self._pending_decodes[key]
+
+    def destroy(self):
+        """Stop the image workers along with the frame."""
+        self._pending_decodes.clear()
+        self._img_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    def _load_card_thumbnail(self, resolved_path, target_h):
+        """Open a card image resized to target_h, reusing an on-disk thumbnail when available.
+
+        Runs on the image worker pool, so it must not touch Tk.
+        """
+        target_h = max(1, int(target_h))
+        thumb_path = None
+        try:
+            mtime_ns = os.stat(resolved_path).st_mtime_ns
+            digest = hashlib.blake2b(resolved_path.encode('utf-8'), digest_size=8).hexdigest()
+            thumb_path = os.path.join(self._thumb_cache_dir, f"{digest}_{mtime_ns}_{target_h}.png")
+            if os.path.exists(thumb_path):
+                img = Image.open(thumb_path)
+                img.load()
+                # Bump the file's mtime so the size cap evicts the least recently used.
+                os.utime(thumb_path)
+                return img
+        except Exception:
+            pass
+
+        img = Image.open(resolved_path)
+        # Resize to target height while keeping aspect ratio
+        h_percent = (target_h / float(img.size[1])) if img.size[1] else 1.0
+        w_size = max(1, int((float(img.size[0]) * float(h_percent))))
+        # Bilinear is indistinguishable from Lanczos at card size and much cheaper on the Pi;
+        # thumbnail() also lets JPEG decode at reduced scale and never upscales.
+        img.thumbnail((w_size, target_h), Image.Resampling.BILINEAR)
+
+        if thumb_path:
+            try:
+                os.makedirs(self._thumb_cache_dir, exist_ok=True)
+                tmp_path = f"{thumb_path}.tmp"
+                img.save(tmp_path, 'PNG', optimize=False)
+                os.replace(tmp_path, thumb_path)
+                self._remove_stale_thumbnails(digest, mtime_ns)
+            except Exception as e:
+                logger.warning("[KioskFrame] Could not write thumbnail for %s: %s", resolved_path, e)
+        return img
+
+    def _remove_stale_thumbnails(self, digest, mtime_ns):
+        """Delete thumbnails cut from earlier versions of the image with this path digest."""
+        prefix = f"{digest}_"
+        current = f"{digest}_{mtime_ns}_"
+        for name in os.listdir(self._thumb_cache_dir):
+            if name.startswith(prefix) and not name.startswith(current):
+                try:
+                    os.remove(os.path.join(self._thumb_cache_dir, name))
+                except OSError:
+                    pass
+
+    def _prune_thumb_cache(self):
+        """Trim the on-disk thumbnail cache to the newest thumb_cache_max_files entries.
+
+        Runs once per start on the image worker pool, so thumbnails of images
+        that were deleted or renamed do not pile up on the SD card.
+        """
+        try:
+            entries = []
+            for entry in os.scandir(self._thumb_cache_dir):
+                if entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            return
+        excess = len(entries) - max(0, self._thumb_cache_max)
+        if excess <= 0:
+            return
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _get_cached_image(self, key):
+        """Return a cached PhotoImage for (path, target_h) and mark it recently used."""
+        photo = self.image_cache.get(key)
+        if photo is not None:
+            self.image_cache.move_to_end(key)
+        return photo
+
+    def _put_cached_image(self, key, photo):
+        """Store a PhotoImage, evicting the least recently used entries past the cap."""
+        self.image_cache[key] = photo
+        self.image_cache.move_to_end(key)
+        while len(self.image_cache) > max(1, self._image_cache_max):
+            self.image_cache.popitem(last=False)
+
     def _compute_num_cols(self, canvas_width):
         """Compute grid columns for current canvas width."""
         if canvas_width < 2:
@@ -1318,24 +1712,13 @@ class KioskFrame(tk.Frame):
 
     def _build_items_layout_signature(self, items, selected_category, num_cols):
         """Build a compact signature to skip redundant full-grid rebuilds."""
-        entries = []
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            try:
-                price_val = float(item.get('price', 0) or 0)
-            except Exception:
-                price_val = 0.0
-            try:
-                qty_val = int(item.get('quantity', 0) or 0)
-            except Exception:
-                qty_val = 0
-            entries.append((
-                item.get('name', ''),
-                price_val,
-                qty_val,
-                item.get('image', ''),
-            ))
+        # Raw field values are compared as-is: this runs on every resize tick,
+        # and a spelling change such as "5" -> 5 only costs one extra rebuild.
+        entries = [
+            (item.get('name', ''), item.get('price', 0), item.get('quantity', 0), item.get('image', ''))
+            for item in items
+            if isinstance(item, dict)
+        ]
         return (str(selected_category or ''), int(num_cols), tuple(entries))
 
     def _resolve_image_path(self, image_path):
@@ -1363,6 +1746,8 @@ class KioskFrame(tk.Frame):
                 elif os.path.exists(fallback):
                     resolved_path = fallback
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[KioskFrame] Resolved image %s -> %s", raw, resolved_path)
         self._image_path_cache[raw] = resolved_path
         return resolved_path
 
@@ -12,6 +12,8 @@ from daily_sales_logger import get_logger
 from datetime import datetime, timedelta
 import os
 import io
+import difflib
+import shutil
 from fix_paths import get_absolute_path
 from system_status_panel import SystemStatusPanel
 from display_profile import get_display_profile
@@ -22,6 +24,9 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
+# Read size for loading log files into the viewer.
+_LOG_CHUNK_SIZE = 64 * 1024
+
 
 def pil_to_photoimage(pil_image):
     """Convert PIL Image to Tkinter PhotoImage using PPM format (no ImageTk needed)."""
@@ -158,15 +163,22 @@ class LogsScreen(tk.Frame):
         self.notebook.add(self.summary_frame, text="Today's Summary")
         self._setup_summary_tab()
         
-        # Tab 2: View Logs
+        # Tab 2: View Logs (built on first use)
         self.logs_frame = tk.Frame(self.notebook, bg="#f0f4f8")
         self.notebook.add(self.logs_frame, text="View Logs")
-        self._setup_logs_tab()
         
-        # Tab 3: History
+        # Tab 3: History (built on first use)
         self.history_frame = tk.Frame(self.notebook, bg="#f0f4f8")
         self.notebook.add(self.history_frame, text="History")
-        self._setup_history_tab()
+
+        # The log viewer and file list read the logs directory, so defer them
+        # until their tab is first opened.
+        self._tab_builders = {
+            str(self.logs_frame): self._setup_logs_tab,
+            str(self.history_frame): self._setup_history_tab,
+        }
+        self._tabs_built = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Bottom button bar
         button_frame = tk.Frame(self, bg="#f0f4f8")
@@ -221,10 +233,22 @@ class LogsScreen(tk.Frame):
             self.refresh_summary()
         except Exception:
             pass
-        try:
-            self.refresh_log_list()
-        except Exception:
-            pass
+        if str(self.history_frame) in self._tabs_built:
+            try:
+                self.refresh_log_list()
+            except Exception:
+                pass
+
+    def _on_tab_changed(self, event=None):
+        self._ensure_tab_built(self.notebook.select())
+
+    def _ensure_tab_built(self, tab_id):
+        """Create a deferred tab's widgets (and run its initial load) the first time it is needed."""
+        builder = self._tab_builders.get(str(tab_id))
+        if builder is None or str(tab_id) in self._tabs_built:
+            return
+        self._tabs_built.add(str(tab_id))
+        builder()
 
     def _refresh_brand_header(self):
         cfg = getattr(self.controller, "config", {}) if isinstance(getattr(self.controller, "config", {}), dict) else {}
@@ -302,6 +326,7 @@ class LogsScreen(tk.Frame):
     def _setup_summary_tab(self):
         """Setup today's sales summary display."""
         # Summary box
+        self._summary_cache_key = None  # (date, logger transaction revision) of the rendered summary
         summary_box = tk.Frame(self.summary_frame, bg="white", relief="sunken", bd=2)
         summary_box.pack(
             fill="both",
@@ -344,6 +369,17 @@ class LogsScreen(tk.Frame):
     def refresh_summary(self):
         """Refresh today's sales summary."""
         self.summary_text.config(state="normal")
+
+        # Nothing was sold since the last render: only bump the timestamp.
+        summary_key = (datetime.now().strftime("%Y-%m-%d"), getattr(self.logger, "transaction_revision", None))
+        if summary_key[1] is not None and summary_key == self._summary_cache_key:
+            footer = self.summary_text.search("Last Updated: ", "end", backwards=True)
+            if footer:
+                self.summary_text.delete(footer, f"{footer} lineend")
+                self.summary_text.insert(footer, f"Last Updated: {datetime.now().strftime('%H:%M:%S')}")
+                self.summary_text.config(state="disabled")
+                return
+        self._summary_cache_key = None
         self.summary_text.delete("1.0", "end")
         
         try:
@@ -354,12 +390,9 @@ class LogsScreen(tk.Frame):
                 today = datetime.now().strftime("%A, %B %d, %Y")
                 
                 # Build items list
-                items_display = ""
                 if items_sold:
-                    items_display = "\n📦 ITEMS SOLD:\n"
-                    for item_name in sorted(items_sold.keys()):
-                        qty = items_sold[item_name]
-                        items_display += f"   {item_name:<35} x{qty:>3}\n"
+                    lines = [f"   {item_name:<35} x{qty:>3}" for item_name, qty in sorted(items_sold.items())]
+                    items_display = "\n📦 ITEMS SOLD:\n" + "\n".join(lines) + "\n"
                 else:
                     items_display = "\n📦 ITEMS SOLD:\n   (No items sold yet)\n"
                 
@@ -389,6 +422,7 @@ class LogsScreen(tk.Frame):
 Last Updated: {datetime.now().strftime('%H:%M:%S')}
                 """
                 self.summary_text.insert("1.0", display)
+                self._summary_cache_key = summary_key
         except Exception as e:
             self.summary_text.insert("1.0", f"Error loading summary:\n{e}")
         
@@ -459,9 +493,18 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}
             log_file = os.path.join(self.logger.logs_dir, f"sales_{log_date}.log")
             
             if os.path.exists(log_file):
-                with open(log_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.log_text.insert("1.0", content)
+                # Insert in chunks so a large log never sits in memory twice,
+                # and let Tk redraw every few chunks while it loads.
+                with open(log_file, "r", encoding="utf-8", buffering=_LOG_CHUNK_SIZE) as f:
+                    chunk_count = 0
+                    while True:
+                        chunk = f.read(_LOG_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        self.log_text.insert("end", chunk)
+                        chunk_count += 1
+                        if chunk_count % 8 == 0:
+                            self.log_text.update_idletasks()
                 self.log_text.insert("end", f"\n\n✓ Loaded {log_date}")
             else:
                 self.log_text.insert("1.0", f"No log file found for {log_date}\n\nLog file should be at:\n{log_file}")
@@ -497,30 +540,41 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}
         self.log_list.pack(fill="both", expand=True, pady=6)
         self.log_list.bind("<<ListboxSelect>>", self.on_log_selected)
         scrollbar.config(command=self.log_list.yview)
+        self._log_list_entries = []  # (filename, display text) rows currently in the Listbox
         
         # Populate list
         self.refresh_log_list()
     
     def refresh_log_list(self):
         """Refresh the list of available log files."""
-        self.log_list.delete(0, "end")
-        
         try:
+            entries = []
             if os.path.exists(self.logger.logs_dir):
-                log_files = sorted(
-                    [f for f in os.listdir(self.logger.logs_dir) if f.startswith("sales_")],
-                    reverse=True
-                )
-                
-                for log_file in log_files:
-                    file_path = os.path.join(self.logger.logs_dir, log_file)
-                    file_size = os.path.getsize(file_path)
-                    file_date = log_file.replace("sales_", "").replace(".log", "")
-                    
-                    display_text = f"{file_date}  ({file_size:,} bytes)"
-                    self.log_list.insert("end", display_text)
+                # scandir yields names and cached stat results in one directory pass.
+                with os.scandir(self.logger.logs_dir) as it:
+                    for entry in it:
+                        if not entry.name.startswith("sales_"):
+                            continue
+                        file_size = entry.stat().st_size
+                        file_date = entry.name.replace("sales_", "").replace(".log", "")
+                        entries.append((entry.name, f"{file_date}  ({file_size:,} bytes)"))
+            entries.sort(reverse=True)
         except Exception as e:
-            self.log_list.insert("end", f"Error: {e}")
+            entries = [(None, f"Error: {e}")]
+        self._sync_log_list(entries)
+
+    def _sync_log_list(self, entries):
+        """Apply only the rows that changed since the last refresh to the Listbox."""
+        matcher = difflib.SequenceMatcher(a=self._log_list_entries, b=entries, autojunk=False)
+        # Apply from the bottom up so earlier indices stay valid.
+        for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                self.log_list.delete(i1, i2 - 1)
+            for offset, (_name, display_text) in enumerate(entries[j1:j2]):
+                self.log_list.insert(i1 + offset, display_text)
+        self._log_list_entries = entries
     
     def on_log_selected(self, event):
         """When a log is selected, load it in the view logs tab."""
@@ -529,6 +583,7 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}
             item_text = self.log_list.get(selection[0])
             # Extract date from display text
             log_date = item_text.split("  ")[0]
+            self._ensure_tab_built(self.logs_frame)
             self.date_var.set(log_date)
             self.load_log_file()
             self.notebook.select(1)  # Switch to view logs tab
@@ -551,10 +606,8 @@ Last Updated: {datetime.now().strftime('%H:%M:%S')}
             )
             
             if save_path:
-                with open(log_file, "r", encoding="utf-8") as src:
-                    content = src.read()
-                with open(save_path, "w", encoding="utf-8") as dst:
-                    dst.write(content)
+                # Byte-for-byte copy; on Linux this stays in the kernel (sendfile).
+                shutil.copyfile(log_file, save_path)
                 messagebox.showinfo("Export Successful", f"Log exported to:\n{save_path}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export log:\n{e}")
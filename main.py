@@ -1,4 +1,5 @@
 ﻿import tkinter as tk
+from tkinter import messagebox
 import time
 import threading
 from kiosk_app import KioskFrame
@@ -8,7 +9,7 @@ import json
 from admin_screen import AdminScreen
 from assign_items_screen import AssignItemsScreen
 from item_screen import ItemScreen
-from cart_screen import CartScreen
+from cart_screen import CartScreen, CartEntry
 from logs_screen import LogsScreen
 from fix_paths import get_absolute_path
 from daily_sales_logger import get_logger
@@ -16,7 +17,20 @@ import subprocess
 import platform
 import os
 import sys
+import pickle
+import random
+import codecs
+import copy
+import queue
+import atexit
+import logging
+import logging.handlers
 from arduino_serial_utils import detect_arduino_serial_port
+# Optional faster JSON parser; its decode errors subclass json.JSONDecodeError.
+try:
+    import orjson
+except Exception:
+    orjson = None
 try:
     from sensor_data_logger import get_sensor_logger
 except Exception:
@@ -51,11 +65,116 @@ try:
 except Exception:
     get_shared_serial_reader = None
 
+# ESP32 TCP/serial client used by the vend paths
+try:
+    from esp32_client import send_command, pulse_slot, ping
+except Exception:
+    send_command = pulse_slot = ping = None
+
+
+# Data files live next to the application; resolve them once at import.
+CONFIG_PATH = get_absolute_path("config.json")
+ASSIGNED_ITEMS_PATH = get_absolute_path("assigned_items.json")
+ITEM_LIST_PATH = get_absolute_path("item_list.json")
+DISPENSE_TIMEOUT_STATE_PATH = get_absolute_path("dispense_timeout_state.json")
+
+# The host OS and X display do not change while the app runs; check them once.
+_IS_LINUX = platform.system() == "Linux"
+_HAS_DISPLAY = bool(os.getenv("DISPLAY"))
+
+# Vend-path diagnostics. Records go through a queue so the console/journald
+# writes happen on a listener thread rather than between motor rotations.
+# Set the "vend" logger to DEBUG for per-pulse responses and slot dumps.
+_vend_log = logging.getLogger("vend")
+
+
+def _init_vend_logging():
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+    _vend_log.addHandler(logging.handlers.QueueHandler(log_queue))
+    _vend_log.setLevel(logging.INFO)
+    _vend_log.propagate = False
+
+
+_init_vend_logging()
+
+def _esp32_reply_ok(reply):
+    """True if an ESP32 reply (str or bytes) acknowledges the command with OK."""
+    if not reply:
+        return False
+    if isinstance(reply, (bytes, bytearray)):
+        return b"OK" in reply.upper()
+    return "OK" in str(reply).upper()
+
+
+# Dialog used by show_dispense_alert for each severity; anything else shows as info.
+_ALERT_FNS = {
+    "error": messagebox.showerror,
+    "warning": messagebox.showwarning,
+    "info": messagebox.showinfo,
+}
+
+
+def _load_json_cached(file_path):
+    """Parse a JSON file, reusing a pickled copy saved next to it while the file is unchanged.
+
+    The cache sits at ``<file_path>.cache.pkl`` and is keyed on the file's
+    mtime and size; any cache problem just falls back to parsing the JSON.
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    cache_path = f"{file_path}.cache.pkl"
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached = pickle.load(cache_file)
+        if cached.get("key") == key:
+            return cached["data"]
+    except Exception:
+        pass
+
+    with open(file_path, "rb") as file:
+        raw = file.read()
+    # Strip a UTF-8 BOM so files saved with one still parse correctly.
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump({"key": key, "data": data}, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"[MainApp] Could not write JSON cache {cache_path}: {e}")
+    return data
+
+
+class _LazyFrameDict(dict):
+    """Screen frames by page name; indexing a screen that does not exist yet builds it."""
+
+    def __init__(self, factory):
+        super().__init__()
+        self._factory = factory
+
+    def __missing__(self, page_name):
+        frame = self._factory(page_name)
+        self[page_name] = frame
+        return frame
+
 
 class MainApp(tk.Tk):
     def __init__(self, *args, **kwargs):
         tk.Tk.__init__(self, *args, **kwargs)
-        self.cart = []
+        self.cart = {}  # _cart_item_key(item) -> CartEntry, in insertion order
+        self._items_by_name = {}  # item name -> position of its first entry in self.items
+        self._items_by_name_list = None  # the self.items list the index was built from
+        self._assigned_slots = None  # see the assigned_slots property
+        self.assigned_term = 0  # active term index; resolved from config below
+        self._slot_index = None  # item name -> [1-based slot numbers]; see _assigned_slot_numbers
+        self._slot_index_key = None  # (id(assigned_slots), assigned_term) the index was built for
         self.tec_controller = None  # TEC Peltier module controller
         self.dispense_monitor = None  # Item dispense IR sensor monitor
         self._arduino_reader = None
@@ -83,19 +202,27 @@ class MainApp(tk.Tk):
         self._customer_idle_timeout_ms = 60000  # Default 60 seconds
         self._customer_session_frames = {"KioskFrame", "ItemScreen", "CartScreen"}
         self._dispense_notice_window = None
+        # Latest TEC/DHT22/IR readings for status panels; see _publish_status.
+        self._status_lock = threading.Lock()
+        self._latest_status = {}  # "tec" / ("dht", n) / "ir" -> status panel update kwargs
+        self._dirty_status = set()  # keys updated since the last flush
+        self._status_flush_pending = False  # set under _status_lock; cleared by the flush
+        # Temperature logging is throttled here rather than on every sensor tick.
+        self._sales_logger = get_logger()
+        self._temp_log_interval = 1.0  # seconds
+        self._last_temp_log_mono = {}  # "tec" / ("dht", n) -> time.monotonic()
         self._dispense_notice_title_label = None
         self._dispense_notice_message_label = None
 
         # Start in fullscreen mode for kiosk display
         self.is_fullscreen = True
+        self._screen_size = None  # cached (width, height); see _screen_dimensions
+        self._window_mode = None  # "fullscreen" / "windowed" last applied by _apply_window_state
         # Set window title
         self.title("RAON Vending Machine")
         
-        # Bind Escape globally so it works in all frames
-        self.bind_all("<Escape>", self.handle_escape)
-        
         # Special handling for Raspberry Pi
-        if platform.system() == "Linux":
+        if _IS_LINUX:
             # Remove window decorations and go fullscreen on Pi
             self.attributes('-type', 'splash')  # Splash window = no decorations
             self.attributes('-zoomed', '1')      # Fullscreen on Pi
@@ -104,7 +231,7 @@ class MainApp(tk.Tk):
             self.overrideredirect(True)  # Remove window decorations and title bar
         
         # Load config first
-        self.config_path = get_absolute_path("config.json")
+        self.config_path = CONFIG_PATH
         self.config = self.load_config_from_json(self.config_path)
         # Ensure coin-change stock config exists for admin monitoring/editing.
         if self._ensure_coin_change_stock_config():
@@ -118,17 +245,24 @@ class MainApp(tk.Tk):
         except Exception:
             timeout_sec = 60.0
         self._customer_idle_timeout_ms = int(max(1.0, timeout_sec) * 1000)
+        self._simulate_checkout_failure = bool(self.config.get("simulate_checkout_failure", False))
         self.ui_font_scale = self._resolve_ui_font_scale()
         self._apply_ui_font_scale()
         
         # Load items from assigned_items.json (the primary data source)
-        self.assigned_items_path = get_absolute_path("assigned_items.json")
+        self.assigned_items_path = ASSIGNED_ITEMS_PATH
         self.assigned_slots = self.load_items_from_json(self.assigned_items_path)
         
         # For backward compatibility, also populate items array
         # Extract items from assigned slots for display in admin and kiosk
         self.items = self._extract_items_from_slots(self.assigned_slots)
-        self.items_file_path = get_absolute_path("item_list.json")  # For legacy support
+        self.items_file_path = ITEM_LIST_PATH  # For legacy support
+        # item_list.json is written off the UI thread; at most one snapshot waits.
+        self._items_save_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._items_save_worker, name="ItemsSaver", daemon=True).start()
+        self._items_dirty = False  # item changes waiting for the debounced save
+        self._items_save_after_id = None
+        self._dirty_frames = set()  # frame names waiting for one populate_items() at idle
         self.currency_symbol = self._normalize_currency_symbol(
             self.config.get("currency_symbol", "\u20b1")
         )
@@ -154,7 +288,6 @@ class MainApp(tk.Tk):
             self._init_arduino_sensor_bridge()
         
         
-        # Apply fullscreen and rotation according to config
         # Apply fullscreen and rotation according to config
         always_fs = bool(self.config.get('always_fullscreen', True))
         allow_admin_deco = bool(self.config.get('allow_decorations_for_admin', False))
@@ -177,9 +310,12 @@ class MainApp(tk.Tk):
             if not d:
                 return
             try:
-                if platform.system() == "Linux" and os.getenv("DISPLAY"):
+                if _IS_LINUX and _HAS_DISPLAY:
                     # Use xrandr to rotate screen (non-persistent)
                     subprocess.run(["xrandr", "-o", d], check=False)
+                    # Rotation swaps the screen's width and height.
+                    self._screen_size = None
+                    self._window_mode = None
             except Exception as e:
                 print(f"Rotation failed: {e}")
 
@@ -213,25 +349,48 @@ class MainApp(tk.Tk):
         container.grid_rowconfigure(0, weight=1)
         container.grid_columnconfigure(0, weight=1)
 
-        self.frames = {}
-        for F in (SelectionScreen, StartOrderScreen, KioskFrame, AdminScreen, AssignItemsScreen, ItemScreen, CartScreen, LogsScreen):
-            page_name = F.__name__
-            frame = F(parent=container, controller=self)
-            self.frames[page_name] = frame
-            # put all of the pages in the same location;
-            # the one on the top of the stacking order
-            # will be the one that is visible.
-            frame.grid(row=0, column=0, sticky="nsew")
+        # Screens are built on first use (self.frames[name]); .get()/.values()
+        # only see screens that already exist, which is all a refresh needs.
+        self._frame_container = container
+        self._frame_classes = {
+            F.__name__: F
+            for F in (SelectionScreen, StartOrderScreen, KioskFrame, AdminScreen, AssignItemsScreen, ItemScreen, CartScreen, LogsScreen)
+        }
+        self.frames = _LazyFrameDict(self._build_frame)
 
         self.active_frame_name = None
         # Default boot path: open kiosk welcome UI directly.
         self.show_start_order()
+        # Build the customer-path screens after the first paint so the first tap stays fast.
+        self.after(200, lambda: self._prebuild_frames(["KioskFrame", "ItemScreen", "CartScreen"]))
         # Poll dashboard-admin notices so kiosk users see admin assistance updates.
         try:
             self.after(1000, self._poll_dashboard_kiosk_notice)
         except Exception:
             pass
 
+    def _build_frame(self, page_name):
+        """Create the screen for page_name and stack it in the shared container."""
+        F = self._frame_classes[page_name]
+        frame = F(parent=self._frame_container, controller=self)
+        # put all of the pages in the same location;
+        # the one on the top of the stacking order
+        # will be the one that is visible.
+        frame.grid(row=0, column=0, sticky="nsew")
+        # A screen built in the background must not cover the one on display.
+        frame.lower()
+        return frame
+
+    def _prebuild_frames(self, page_names):
+        """Build the given screens one per event-loop turn."""
+        if not page_names:
+            return
+        try:
+            self.frames[page_names[0]]
+        except Exception as e:
+            print(f"[MainApp] Failed to build {page_names[0]}: {e}")
+        self.after(50, lambda: self._prebuild_frames(page_names[1:]))
+
     def _init_tec_controller(self):
         """Initialize TEC Peltier module controller if enabled."""
         if not TEC_AVAILABLE:
@@ -288,7 +447,8 @@ class MainApp(tk.Tk):
                 average_sensors=average_sensors,
                 use_esp32_serial=use_esp32_dht,
                 esp32_port=esp32_dht_port,
-                esp32_baud=esp32_dht_baud
+                esp32_baud=esp32_dht_baud,
+                change_only=True
             )
             
             # Register status callback for UI panel
@@ -312,6 +472,9 @@ class MainApp(tk.Tk):
     def _on_closing(self):
         """Handle window closing event - cleanup TEC controller and dispense monitor."""
         self._arduino_sensor_bridge_running = False
+        # Let a pending item_list.json write finish before exiting.
+        self._flush_items_save()
+        self._items_save_queue.join()
         if self.tec_controller:
             self.tec_controller.cleanup()
         if self.dispense_monitor:
@@ -597,7 +760,8 @@ class MainApp(tk.Tk):
                 simulate_detection=simulate_detection,
                 use_esp32_serial=use_esp32_ir,
                 serial_port=serial_port,
-                serial_baud=serial_baud
+                serial_baud=serial_baud,
+                change_only=True
             )
             
             # Register callbacks for UI alerts
@@ -640,31 +804,21 @@ class MainApp(tk.Tk):
             if self._should_invert_tec_status():
                 panel_active = not panel_active
 
-            # Update all frames that expose a status_panel so UI shows
-            # sensor/TEC updates regardless of which view is active.
-            for frame in self.frames.values():
-                try:
-                    if hasattr(frame, 'status_panel') and frame.status_panel:
-                        # Schedule widget updates on the main/UI thread
-                        try:
-                            frame.after(0, lambda f=frame, e=enabled, a=panel_active, t=target_temp, c=current_temp: f.status_panel.update_tec_status(enabled=e, active=a, target_temp=t, current_temp=c))
-                        except Exception:
-                            # Fallback: direct call if scheduling fails
-                            frame.status_panel.update_tec_status(enabled=enabled, active=panel_active, target_temp=target_temp, current_temp=current_temp)
-                except Exception:
-                    pass
+            self._publish_status(
+                "tec",
+                dict(enabled=enabled, active=panel_active, target_temp=target_temp, current_temp=current_temp),
+            )
             
             # Log temperature periodically (not on every update to avoid spam)
-            try:
-                logger = get_logger()
-                # Only log if this is a significant change or periodic (checked by logger)
-                logger.log_temperature(
-                    sensor_1_temp=current_temp,
-                    relay_status=panel_active,
-                    target_temp=target_temp
-                )
-            except Exception as e:
-                print(f"[MainApp] Error logging temperature: {e}")
+            if self._temp_log_due("tec"):
+                try:
+                    self._sales_logger.log_temperature(
+                        sensor_1_temp=current_temp,
+                        relay_status=panel_active,
+                        target_temp=target_temp
+                    )
+                except Exception as e:
+                    print(f"[MainApp] Error logging temperature: {e}")
 
             self._update_latest_sensor_snapshot(
                 relay_status=panel_active,
@@ -673,36 +827,89 @@ class MainApp(tk.Tk):
         except Exception as e:
             print(f"[MainApp] Error updating TEC status panel: {e}")
     
+    def _temp_log_due(self, key):
+        """Return True at most once per _temp_log_interval for each sensor key."""
+        now = time.monotonic()
+        last = self._last_temp_log_mono.get(key)
+        if last is not None and now - last < self._temp_log_interval:
+            return False
+        self._last_temp_log_mono[key] = now
+        return True
+
+    def _publish_status(self, key, values):
+        """Record the latest status reading and schedule one push to the visible screen.
+
+        Callbacks arrive from sensor threads; bursts collapse into a single
+        idle-time flush, and hidden screens catch up when show_frame pushes
+        the stored readings to them.
+        """
+        with self._status_lock:
+            if self._latest_status.get(key) == values:
+                return  # unchanged reading; nothing to redraw
+            self._latest_status[key] = values
+            self._dirty_status.add(key)
+            if self._status_flush_pending:
+                return
+            self._status_flush_pending = True
+        # The after-id is not kept: the flush may run before after_idle returns,
+        # so only the flag set under the lock tracks the pending push.
+        try:
+            self.after_idle(self._flush_status)
+        except Exception:
+            with self._status_lock:
+                self._status_flush_pending = False
+
+    def _flush_status(self):
+        """Apply the readings that changed since the last flush to the active screen."""
+        self._push_status_to_active(changed_only=True)
+
+    def _push_status_to_active(self, changed_only=False):
+        """Apply the latest TEC/DHT22/IR readings to the active screen's status panel."""
+        with self._status_lock:
+            if changed_only:
+                self._status_flush_pending = False
+                latest = {key: self._latest_status[key] for key in self._dirty_status}
+            else:
+                latest = dict(self._latest_status)
+            self._dirty_status.clear()
+        frame = self.frames.get(self.active_frame_name) if self.active_frame_name else None
+        panel = getattr(frame, 'status_panel', None)
+        if not panel:
+            return
+        for key, values in latest.items():
+            try:
+                if key == "tec":
+                    panel.update_tec_status(**values)
+                elif key == "ir":
+                    panel.update_ir_status(**values)
+                else:
+                    panel.update_dht22_reading(**values)
+            except Exception:
+                pass
+
     def _on_dht22_update(self, sensor_number, temp, humidity):
         """Handle DHT22 sensor updates - update status panel."""
         try:
-            # Update all frames that expose a status_panel so UI shows
-            # DHT readings regardless of which view is active.
             # Debug: notify console that a DHT22 update was received
             try:
                 print(f"[MainApp] DHT22 update: sensor={sensor_number} temp={temp} hum={humidity}")
             except Exception:
                 pass
 
-            for frame in self.frames.values():
-                try:
-                    if hasattr(frame, 'status_panel') and frame.status_panel:
-                        try:
-                            frame.after(0, lambda f=frame, s=sensor_number, tt=temp, hh=humidity: f.status_panel.update_dht22_reading(sensor_number=s, temp=tt, humidity=hh))
-                        except Exception:
-                            frame.status_panel.update_dht22_reading(sensor_number=sensor_number, temp=temp, humidity=humidity)
-                except Exception:
-                    pass
+            self._publish_status(
+                ("dht", sensor_number),
+                dict(sensor_number=sensor_number, temp=temp, humidity=humidity),
+            )
             
             # Log temperature reading (DHT22 updates less frequently)
-            try:
-                logger = get_logger()
-                if sensor_number == 1:
-                    logger.log_temperature(sensor_1_temp=temp)
-                elif sensor_number == 2:
-                    logger.log_temperature(sensor_2_temp=temp)
-            except Exception as e:
-                pass  # Silently ignore logging errors
+            if self._temp_log_due(("dht", sensor_number)):
+                try:
+                    if sensor_number == 1:
+                        self._sales_logger.log_temperature(sensor_1_temp=temp)
+                    elif sensor_number == 2:
+                        self._sales_logger.log_temperature(sensor_2_temp=temp)
+                except Exception as e:
+                    pass  # Silently ignore logging errors
         except Exception as e:
             print(f"[MainApp] Error updating DHT22 status panel: {e}")
     
@@ -713,17 +920,10 @@ class MainApp(tk.Tk):
                 ir_sensor1_detection=sensor_1,
                 ir_sensor2_detection=sensor_2
             )
-            # Update all frames that expose a status_panel so UI shows
-            # IR updates regardless of which view is active.
-            for frame in self.frames.values():
-                try:
-                    if hasattr(frame, 'status_panel') and frame.status_panel:
-                        try:
-                            frame.after(0, lambda f=frame, s1=sensor_1, s2=sensor_2, dm=detection_mode, ld=last_detection: f.status_panel.update_ir_status(sensor_1=s1, sensor_2=s2, detection_mode=dm, last_detection=ld))
-                        except Exception:
-                            frame.status_panel.update_ir_status(sensor_1=sensor_1, sensor_2=sensor_2, detection_mode=detection_mode, last_detection=last_detection)
-                except Exception:
-                    pass
+            self._publish_status(
+                "ir",
+                dict(sensor_1=sensor_1, sensor_2=sensor_2, detection_mode=detection_mode, last_detection=last_detection),
+            )
         except Exception as e:
             print(f"[MainApp] Error updating IR status panel: {e}")
 
@@ -808,15 +1008,10 @@ class MainApp(tk.Tk):
             message (str): Alert message
             severity (str): 'error', 'warning', or 'info'
         """
-        from tkinter import messagebox
+        show_fn = _ALERT_FNS.get(severity, messagebox.showinfo)
 
         def _show():
-            if severity == "error":
-                messagebox.showerror(title, message)
-            elif severity == "warning":
-                messagebox.showwarning(title, message)
-            else:
-                messagebox.showinfo(title, message)
+            show_fn(title, message)
 
         # Timeout callbacks come from a worker thread; marshal dialogs to Tk main thread.
         try:
@@ -886,8 +1081,9 @@ class MainApp(tk.Tk):
 
                     self.update_idletasks()
                     width, height = 840, 360
-                    x = max(0, (self.winfo_screenwidth() - width) // 2)
-                    y = max(0, (self.winfo_screenheight() - height) // 2)
+                    screen_width, screen_height = self._screen_dimensions()
+                    x = max(0, (screen_width - width) // 2)
+                    y = max(0, (screen_height - height) // 2)
                     win.geometry(f"{width}x{height}+{x}+{y}")
                     self._dispense_notice_window = win
 
@@ -911,10 +1107,7 @@ class MainApp(tk.Tk):
 
     def _dispense_timeout_state_path(self):
         """Return shared state path used by dashboard and kiosk notice flow."""
-        try:
-            return get_absolute_path("dispense_timeout_state.json")
-        except Exception:
-            return "dispense_timeout_state.json"
+        return DISPENSE_TIMEOUT_STATE_PATH
 
     def _load_dispense_timeout_state(self):
         path = self._dispense_timeout_state_path()
@@ -1003,33 +1196,102 @@ class MainApp(tk.Tk):
         Uses the currently selected term (default 0 = Term 1).
         """
         items = []
+        append = items.append
         try:
-            term_idx = getattr(self, 'assigned_term', 0) or 0
+            term_idx = self.assigned_term or 0
             
             if isinstance(assigned_slots, list):
                 for idx, slot in enumerate(assigned_slots):
-                    if isinstance(slot, dict) and 'terms' in slot:
-                        terms = slot.get('terms', [])
+                    if not isinstance(slot, dict):
+                        continue
+                    terms = slot.get('terms')
+                    if terms is not None:
                         if len(terms) > term_idx and terms[term_idx]:
-                            term_item = dict(terms[term_idx])
-                            term_item['_slot_number'] = idx + 1
-                            items.append(term_item)
-                    elif isinstance(slot, dict) and 'name' in slot:
+                            append({**terms[term_idx], '_slot_number': idx + 1})
+                    elif 'name' in slot:
                         # Legacy format - just add the slot directly
-                        slot_item = dict(slot)
-                        slot_item['_slot_number'] = idx + 1
-                        items.append(slot_item)
+                        append({**slot, '_slot_number': idx + 1})
         except Exception as e:
             print(f"Error extracting items from slots: {e}")
         
         return items
 
+    @property
+    def assigned_slots(self):
+        return self._assigned_slots
+
+    @assigned_slots.setter
+    def assigned_slots(self, slots):
+        # AssignItemsScreen republishes its slots on every save, so any
+        # assignment drops the slot index built from the previous contents.
+        self._assigned_slots = slots
+        self._slot_index = None
+
+    @staticmethod
+    def _slot_item_names(slot, term_idx):
+        """Item names a slot answers to: its legacy 'name' and its active term's name."""
+        if not isinstance(slot, dict):
+            return ()
+        names = []
+        if slot.get('name'):
+            names.append(slot.get('name'))
+        terms = slot.get('terms')
+        if isinstance(terms, list) and len(terms) > term_idx:
+            term_entry = terms[term_idx]
+            if isinstance(term_entry, dict) and term_entry.get('name'):
+                names.append(term_entry.get('name'))
+        return names
+
+    def _assigned_slot_numbers(self, item_name):
+        """Return the 1-based slot numbers assigned to item_name for the active term.
+
+        Uses a name -> slots index keyed on the assigned_slots list and term;
+        hits are re-checked against the slots and a miss rebuilds the index
+        once, so in-place edits elsewhere stay safe.
+        """
+        assigned = self.assigned_slots or []
+        term_idx = self.assigned_term or 0
+        key = (id(assigned), term_idx)
+        for attempt in range(2):
+            if attempt or self._slot_index is None or self._slot_index_key != key:
+                index = {}
+                for idx, slot in enumerate(assigned):
+                    for name in set(self._slot_item_names(slot, term_idx)):
+                        index.setdefault(name, []).append(idx + 1)
+                self._slot_index = index
+                self._slot_index_key = key
+            matches = self._slot_index.get(item_name, [])
+            if attempt or (matches and all(
+                n <= len(assigned) and item_name in self._slot_item_names(assigned[n - 1], term_idx)
+                for n in matches
+            )):
+                return list(matches)
+        return []
+
+    def _find_item_index(self, item_name):
+        """Return the position of the first entry named item_name in self.items, or None.
+
+        Uses a name index that is rebuilt when self.items is replaced or a
+        lookup finds it out of date, so in-place edits elsewhere stay safe.
+        """
+        items = getattr(self, 'items', None) or []
+        for attempt in range(2):
+            if attempt or self._items_by_name_list is not items:
+                index = {}
+                for pos, item in enumerate(items):
+                    if isinstance(item, dict):
+                        index.setdefault(item.get("name"), pos)
+                self._items_by_name = index
+                self._items_by_name_list = items
+            pos = self._items_by_name.get(item_name)
+            if pos is not None and pos < len(items) and isinstance(items[pos], dict) and items[pos].get("name") == item_name:
+                return pos
+        return None
+
     def load_items_from_json(self, file_path):
         """Loads item data from a JSON file."""
         try:
-            # Use utf-8-sig so files with UTF-8 BOM still parse correctly.
-            with open(file_path, "r", encoding="utf-8-sig") as file:
-                data = json.load(file)
+            data = _load_json_cached(file_path)
             # Clamp assigned_items.json to 40 slots if older data exists
             try:
                 if isinstance(data, list) and os.path.basename(file_path) == "assigned_items.json":
@@ -1055,9 +1317,7 @@ class MainApp(tk.Tk):
     def load_config_from_json(self, file_path):
         """Loads item data from a JSON file."""
         try:
-            # Use utf-8-sig so files with UTF-8 BOM still parse correctly.
-            with open(file_path, "r", encoding="utf-8-sig") as file:
-                return json.load(file)
+            return _load_json_cached(file_path)
         except FileNotFoundError:
             print(
                 f"Warning: {file_path} not found. Generating a new one with default items."
@@ -1259,14 +1519,94 @@ class MainApp(tk.Tk):
         return symbol
 
     def save_items_to_json(self):
-        """Saves the current item list to the JSON file."""
-        with open(self.items_file_path, "w") as file:
-            json.dump(self.items, file, indent=4)
+        """Saves the current item list to the JSON file.
+
+        The write happens on a background thread; a snapshot still waiting
+        to be written is replaced by the newer one.
+        """
+        snapshot = copy.deepcopy(self.items)
+        while True:
+            try:
+                self._items_save_queue.put_nowait(snapshot)
+                return
+            except queue.Full:
+                try:
+                    self._items_save_queue.get_nowait()
+                    self._items_save_queue.task_done()
+                except queue.Empty:
+                    pass
+
+    def _schedule_items_save(self):
+        """Mark the item list dirty and save it once the current burst of edits settles."""
+        if threading.current_thread() is not threading.main_thread():
+            # Tk timers can only be set from the UI thread.
+            self.save_items_to_json()
+            return
+        self._items_dirty = True
+        if self._items_save_after_id is None:
+            self._items_save_after_id = self.after(250, self._flush_items_save)
+
+    def _flush_items_save(self):
+        """Queue the pending item list write now, if there is one."""
+        if self._items_save_after_id is not None:
+            try:
+                self.after_cancel(self._items_save_after_id)
+            except Exception:
+                pass
+            self._items_save_after_id = None
+        if self._items_dirty:
+            self._items_dirty = False
+            self.save_items_to_json()
+
+    def _schedule_repaint(self, frame_name):
+        """Rebuild a frame's item list at the next idle point, once per burst of edits."""
+        if threading.current_thread() is not threading.main_thread():
+            # Worker threads (e.g. payment stock deductions) must not touch Tk.
+            self.after(0, lambda: self._schedule_repaint(frame_name))
+            return
+        if not self._dirty_frames:
+            self.after_idle(self._repaint_dirty_frames)
+        self._dirty_frames.add(frame_name)
+
+    def _repaint_dirty_frames(self):
+        dirty, self._dirty_frames = self._dirty_frames, set()
+        for frame_name in dirty:
+            try:
+                frame = self.frames.get(frame_name)
+                if frame:
+                    frame.populate_items()
+            except Exception as e:
+                print(f"[MainApp] Failed to refresh {frame_name}: {e}")
+
+    def _items_save_worker(self):
+        """Write queued item snapshots to item_list.json (temp file + rename)."""
+        while True:
+            items = self._items_save_queue.get()
+            try:
+                tmp_path = f"{self.items_file_path}.tmp"
+                with open(tmp_path, "w") as file:
+                    json.dump(items, file, indent=4)
+                os.replace(tmp_path, self.items_file_path)
+            except Exception as e:
+                print(f"[MainApp] Failed to save {self.items_file_path}: {e}")
+            finally:
+                self._items_save_queue.task_done()
+
+    def _screen_dimensions(self):
+        """Screen (width, height); queried from Tk once and cached until the display is rotated."""
+        if self._screen_size is None:
+            self._screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        return self._screen_size
+
+    def _fullscreen_geometry(self):
+        width, height = self._screen_dimensions()
+        return f"{width}x{height}+0+0"
 
     def toggle_fullscreen(self, event=None):
         """Toggles fullscreen mode for the SelectionScreen."""
         if self.active_frame_name == "SelectionScreen":
             self.is_fullscreen = not self.is_fullscreen
+            self._window_mode = None
             if self.is_fullscreen:
                 self.attributes("-fullscreen", True)
                 self.overrideredirect(True)
@@ -1275,24 +1615,30 @@ class MainApp(tk.Tk):
                 self.overrideredirect(False)
                 self.state('normal')
                 # Set a reasonable default size
-                width = min(1024, self.winfo_screenwidth() - 100)
-                height = min(768, self.winfo_screenheight() - 100)
-                x = (self.winfo_screenwidth() - width) // 2
-                y = (self.winfo_screenheight() - height) // 2
+                screen_width, screen_height = self._screen_dimensions()
+                width = min(1024, screen_width - 100)
+                height = min(768, screen_height - 100)
+                x = (screen_width - width) // 2
+                y = (screen_height - height) // 2
                 self.geometry(f"{width}x{height}+{x}+{y}")
 
-    def show_frame(self, page_name):
-        """Show a frame for the given page name"""
-        frame = self.frames[page_name]
-        self.active_frame_name = page_name
+    def _apply_window_state(self, page_name):
+        """Put the main window in the fullscreen/windowed state the page needs.
 
-        # Handle window state differently for Linux/Raspberry Pi
-        is_linux = platform.system() == "Linux"
+        Customer screens all share the fullscreen state, so the attribute and
+        geometry calls are skipped when that state is already applied.
+        """
         always_fullscreen = bool(self._kiosk_config.get('always_fullscreen', True))
+        windowed = page_name == "SelectionScreen" and not always_fullscreen
+        mode = "windowed" if windowed else "fullscreen"
+        if mode == self._window_mode:
+            return
+        self._window_mode = mode
 
-        if page_name == "SelectionScreen" and not always_fullscreen:
+        if windowed:
             try:
-                if is_linux:
+                # Handle window state differently for Linux/Raspberry Pi
+                if _IS_LINUX:
                     # On Pi (windowed mode): use normal window with decorations
                     self.attributes("-fullscreen", False)
                     self.attributes('-type', 'normal')
@@ -1304,52 +1650,57 @@ class MainApp(tk.Tk):
                     self.attributes("-fullscreen", False)
                 
                 # Set a reasonable default size
-                width = min(1024, self.winfo_screenwidth() - 100)
-                height = min(768, self.winfo_screenheight() - 100)
-                x = (self.winfo_screenwidth() - width) // 2
-                y = (self.winfo_screenheight() - height) // 2
+                screen_width, screen_height = self._screen_dimensions()
+                width = min(1024, screen_width - 100)
+                height = min(768, screen_height - 100)
+                x = (screen_width - width) // 2
+                y = (screen_height - height) // 2
                 self.geometry(f"{width}x{height}+{x}+{y}")
             except Exception as e:
                 print(f"Error setting window state: {e}")
         else:
             try:
-                if is_linux:
+                if _IS_LINUX:
                     # On Pi: force kiosk fullscreen with no decorations
                     self.attributes("-fullscreen", True)
                     self.attributes('-type', 'splash')
                     self.attributes('-zoomed', '1')
                     # Force fullscreen geometry
-                    self.geometry(f"{self.winfo_screenwidth()}x{self.winfo_screenheight()}+0+0")
+                    self.geometry(self._fullscreen_geometry())
                 else:
                     # On Windows: use standard fullscreen
                     self.attributes("-fullscreen", True)
                     self.overrideredirect(True)
-                    self.geometry(f"{self.winfo_screenwidth()}x{self.winfo_screenheight()}+0+0")
+                    self.geometry(self._fullscreen_geometry())
             except Exception as e:
                 print(f"Error setting fullscreen: {e}")
 
+    def show_frame(self, page_name):
+        """Show a frame for the given page name"""
+        frame = self.frames[page_name]
+        self.active_frame_name = page_name
+        self._apply_window_state(page_name)
+
         # Raise the frame and ensure it has focus
         frame.tkraise()
         self.update_idletasks()  # Process any pending window manager tasks
         
-        # Single focus attempt - avoid potential recursion
-        focus_set = False
-        for focus_method in [self.focus_force, self.focus_set, frame.focus_set]:
-            if not focus_set:
+        # Single focus attempt - avoid potential recursion. Focus the main
+        # window so global bindings (Escape) are received.
+        try:
+            self.focus_force()
+        except Exception:
+            try:
+                self.focus_set()
+            except Exception:
                 try:
-                    focus_method()
-                    focus_set = True
+                    frame.focus_set()
                 except Exception:
                     pass
 
+        # Bring the screen's status panel up to date before it refreshes on show.
+        self._push_status_to_active()
         frame.event_generate("<<ShowFrame>>")
-        frame.tkraise()
-        # Force focus back to the main window so global bindings (Escape) are received
-        if not focus_set:
-            try:
-                self.focus_force()
-            except Exception:
-                pass
         self._sync_customer_idle_watchdog(reset=True)
 
     def _on_customer_activity(self, event=None):
@@ -1420,6 +1771,7 @@ class MainApp(tk.Tk):
         decorations (title bar) are removed. When disabled, decorations
         are restored and fullscreen is disabled.
         """
+        self._window_mode = None
         if enable:
             self.is_fullscreen = True
             # Try to remove window decorations first, then set fullscreen
@@ -1433,7 +1785,7 @@ class MainApp(tk.Tk):
                 pass
             # Ensure geometry covers the entire screen
             try:
-                self.geometry(f"{self.winfo_screenwidth()}x{self.winfo_screenheight()}+0+0")
+                self.geometry(self._fullscreen_geometry())
             except Exception:
                 pass
         else:
@@ -1448,8 +1800,7 @@ class MainApp(tk.Tk):
                 pass
             # Optionally set a sensible windowed geometry
             try:
-                screen_width = self.winfo_screenwidth()
-                screen_height = self.winfo_screenheight()
+                screen_width, screen_height = self._screen_dimensions()
                 width = screen_width // 2
                 height = screen_height
                 x = screen_width // 2
@@ -1460,17 +1811,12 @@ class MainApp(tk.Tk):
     def show_kiosk(self):
         """Show the kiosk interface and reset its state."""
         self.frames["KioskFrame"].reset_state()
-        # First update the frame name
-        self.active_frame_name = "KioskFrame"
-        # Then show the frame (which will make it fullscreen)
+        # show_frame makes it fullscreen and focuses the main window for key bindings
         self.show_frame("KioskFrame")
-        # Force focus back to main window for key bindings
-        self.focus_force()
 
     def show_start_order(self):
         """Show kiosk landing/start screen."""
         self.show_frame("StartOrderScreen")
-        self.focus_force()
 
     def start_order(self):
         """Start a new order session and open kiosk menu."""
@@ -1505,7 +1851,7 @@ class MainApp(tk.Tk):
 
     def show_cart(self):
         """Passes cart data to the CartScreen and displays it."""
-        self.frames["CartScreen"].update_cart(self.cart)
+        self.frames["CartScreen"].update_cart(list(self.cart.values()))
         self.show_frame("CartScreen")
 
     def _item_slot_number(self, item_obj):
@@ -1535,12 +1881,9 @@ class MainApp(tk.Tk):
             available = int(added_item.get("quantity", 0))
         except Exception:
             available = 0
-        current_in_cart = 0
         added_key = self._cart_item_key(added_item)
-        for item_info in self.cart:
-            if self._cart_item_key(item_info["item"]) == added_key:
-                current_in_cart = item_info["quantity"]
-                break
+        item_info = self.cart.get(added_key)
+        current_in_cart = item_info.quantity if item_info else 0
         if available <= current_in_cart:
             return
         # Clamp requested quantity to remaining availability
@@ -1549,25 +1892,16 @@ class MainApp(tk.Tk):
         if quantity <= 0:
             return
         # Check if item is already in cart
-        for item_info in self.cart:
-            if self._cart_item_key(item_info["item"]) == added_key:
-                item_info["quantity"] += quantity
-                return  # Exit after updating
+        if item_info:
+            item_info.quantity += quantity
+            return  # Exit after updating
 
         # If not in cart, add as a new entry
-        self.cart.append({"item": added_item, "quantity": quantity})
+        self.cart[added_key] = CartEntry(added_item, quantity)
 
     def remove_from_cart(self, item_to_remove):
         """Removes an item entirely from the cart and restores its quantity."""
-        item_found = None
-        target_key = self._cart_item_key(item_to_remove)
-        for item_info in self.cart:
-            if self._cart_item_key(item_info["item"]) == target_key:
-                item_found = item_info
-                break
-
-        if item_found:
-            self.cart.remove(item_found)
+        if self.cart.pop(self._cart_item_key(item_to_remove), None) is not None:
             self.show_cart()  # Refresh cart screen
 
     def increase_cart_item_quantity(self, item_to_increase):
@@ -1577,25 +1911,21 @@ class MainApp(tk.Tk):
             available = int(item_to_increase.get("quantity", 0))
         except Exception:
             available = 0
-        target_key = self._cart_item_key(item_to_increase)
-        for cart_item_info in self.cart:
-            if self._cart_item_key(cart_item_info["item"]) == target_key:
-                if cart_item_info["quantity"] < available:
-                    cart_item_info["quantity"] += 1
-                    self.show_cart()  # Refresh cart screen
-                return
+        cart_item_info = self.cart.get(self._cart_item_key(item_to_increase))
+        if cart_item_info and cart_item_info.quantity < available:
+            cart_item_info.quantity += 1
+            self.show_cart()  # Refresh cart screen
 
     def decrease_cart_item_quantity(self, item_to_decrease):
         """Decreases an item's quantity in the cart by 1."""
-        target_key = self._cart_item_key(item_to_decrease)
-        for item_info in self.cart:
-            if self._cart_item_key(item_info["item"]) == target_key:
-                if item_info["quantity"] > 1:
-                    item_info["quantity"] -= 1
-                    self.show_cart()  # Refresh cart screen
-                else:  # If quantity is 1, remove it completely
-                    self.remove_from_cart(item_to_decrease)
-                return
+        item_info = self.cart.get(self._cart_item_key(item_to_decrease))
+        if not item_info:
+            return
+        if item_info.quantity > 1:
+            item_info.quantity -= 1
+            self.show_cart()  # Refresh cart screen
+        else:  # If quantity is 1, remove it completely
+            self.remove_from_cart(item_to_decrease)
 
     def clear_cart(self):
         """Empties the cart."""
@@ -1605,9 +1935,9 @@ class MainApp(tk.Tk):
         """Return available stock for an item based on assigned slots (current term)."""
         if not item_name:
             return 0
-        assigned = getattr(self, 'assigned_slots', None)
+        assigned = self.assigned_slots
         if isinstance(assigned, list) and assigned:
-            term_idx = getattr(self, 'assigned_term', 0) or 0
+            term_idx = self.assigned_term or 0
             total = 0
             for slot in assigned:
                 try:
@@ -1621,19 +1951,19 @@ class MainApp(tk.Tk):
                     continue
             return max(0, total)
         # Fallback to items list
-        for item in getattr(self, 'items', []):
-            if item.get('name') == item_name:
-                return max(0, int(item.get('quantity', 0)))
+        pos = self._find_item_index(item_name)
+        if pos is not None:
+            return max(0, int(self.items[pos].get('quantity', 0)))
         return 0
 
     def _decrement_assigned_stock(self, item_name, quantity, preferred_slot=None):
         """Decrement stock for an item, optionally targeting a specific slot first."""
         if quantity <= 0:
             return 0
-        assigned = getattr(self, 'assigned_slots', None)
+        assigned = self.assigned_slots
         if not isinstance(assigned, list) or not assigned:
             return 0
-        term_idx = getattr(self, 'assigned_term', 0) or 0
+        term_idx = self.assigned_term or 0
         # Collect matching slot indices
         matches = []
         for idx, slot in enumerate(assigned):
@@ -1704,29 +2034,23 @@ class MainApp(tk.Tk):
         # Refresh derived items list and kiosk view
         try:
             self.items = self._extract_items_from_slots(self.assigned_slots)
-            kf = self.frames.get("KioskFrame")
-            if kf:
-                kf.populate_items()
+            self._schedule_repaint("KioskFrame")
         except Exception:
             pass
 
     def handle_checkout(self, checked_out_items):
         """
-        Processes items at checkout. In a real app, this would handle payment.
-        Here, we simulate a potential failure.
+        Processes items at checkout. Payment itself is handled by CartScreen;
+        set "simulate_checkout_failure" in config.json to exercise the failure path.
         Returns True on success, False on failure.
         """
-
-        # TODO: Replace this simulation with real payment processing logic.
-        import random
-
-        # Simulate a 50% chance of checkout failure
-        if random.random() < 0.5:
+        # Simulate a 50% chance of checkout failure (testing only)
+        if self._simulate_checkout_failure and random.random() < 0.5:
             print("Checkout failed. (Simulated)")
             return False
 
         print("Checkout successful. Items processed:", checked_out_items)
-        self.save_items_to_json()  # Persist the new quantities
+        self._schedule_items_save()  # Persist the new quantities
         # Attempt to vend physical slots for items that were checked out
         try:
             # Keep dispensing deterministic: ascending slot order, one slot at a time.
@@ -1737,20 +2061,17 @@ class MainApp(tk.Tk):
         return True
 
     def reduce_item_quantity(self, item, quantity):
-        """Reduces the quantity of the item in the KioskFrame."""
-        kiosk_frame = self.frames["KioskFrame"]
-        for index in range(len(kiosk_frame.items)):
-            kiosk_item = kiosk_frame.items[index]
-            if kiosk_item["name"] == item["name"]:
-                print(f"Reducing {item['name']} quantity by {quantity}")
-                self.items[index]["quantity"] -= quantity
+        """Reduces the quantity of an item in the master item list."""
+        pos = self._find_item_index(item["name"])
+        if pos is not None:
+            print(f"Reducing {item['name']} quantity by {quantity}")
+            self.items[pos]["quantity"] -= quantity
 
     def increase_item_quantity(self, item, quantity):
         """Increases the quantity of an item in the master item list."""
-        for master_item in self.items:
-            if master_item["name"] == item["name"]:
-                master_item["quantity"] += quantity
-                return
+        pos = self._find_item_index(item["name"])
+        if pos is not None:
+            self.items[pos]["quantity"] += quantity
 
     def add_item(self, new_item_data):
         """
@@ -1763,10 +2084,10 @@ class MainApp(tk.Tk):
             return False  # Item with this name already exists
 
         self.items.append(new_item_data)
-        self.save_items_to_json()
+        self._schedule_items_save()
         # Refresh screens that show items
-        self.frames["AdminScreen"].populate_items()
-        self.frames["KioskFrame"].populate_items()
+        self._schedule_repaint("AdminScreen")
+        self._schedule_repaint("KioskFrame")
         return True
 
     def _parse_active_slots_from_status(self, status_msg):
@@ -1791,9 +2112,7 @@ class MainApp(tk.Tk):
         A valid completion requires seeing slot transition active -> stable inactive.
         Firmware stops the motor after 2 limit-switch pulses (or failsafe timeout).
         """
-        try:
-            from esp32_client import send_command
-        except Exception:
+        if send_command is None:
             return False
 
         deadline = time.time() + max(1.0, float(timeout_sec))
@@ -1802,6 +2121,11 @@ class MainApp(tk.Tk):
         required_inactive = max(1, int(min_inactive_polls))
         while time.time() < deadline:
             try:
+                # Skip STATUS only when no transport is left. A USB-wired board
+                # that took the PULSE via the serial fallback passes without a probe.
+                if not ping(host, timeout=0.5):
+                    time.sleep(max(0.05, float(poll_interval_sec)))
+                    continue
                 status_msg = send_command(host, "STATUS", timeout=1.0)
                 active_slots = self._parse_active_slots_from_status(status_msg)
                 if int(slot_number) in active_slots:
@@ -1817,6 +2141,110 @@ class MainApp(tk.Tk):
             time.sleep(max(0.05, float(poll_interval_sec)))
         return False
 
+    def _vend_settings(self):
+        """Read the ESP32 host and vend timing settings from config in one pass.
+
+        Called once per vend request so the dispense loops do not walk the
+        config dicts for every rotation; admin edits apply to the next vend.
+        """
+        cfg = self.config if isinstance(self.config, dict) else {}
+        hw = cfg.get('hardware', {})
+        if not isinstance(hw, dict):
+            hw = {}
+
+        def _non_negative_int(key, default):
+            try:
+                return max(0, int(hw.get(key, default)))
+            except Exception:
+                return default
+
+        try:
+            # Failsafe timeout; normal stop is 2 limit-switch pulses
+            pulse_timeout_ms = int(hw.get('vend_rotation_failsafe_ms', 15000))
+        except Exception:
+            pulse_timeout_ms = 15000
+        try:
+            settle_ms = int(hw.get('vend_settle_ms', 200))
+            settle_sec = settle_ms / 1000.0 if settle_ms > 0 else 0.0
+        except Exception:
+            settle_sec = 0.2
+        ir_cfg = hw.get('ir_sensors', {})
+        return {
+            # common AP fallback; set esp32_host in config for your network
+            'host': cfg.get('esp32_host') or '192.168.4.1',
+            'pulse_timeout_ms': pulse_timeout_ms,
+            'dispense_timeout': ir_cfg.get('dispense_timeout', 30.0) if isinstance(ir_cfg, dict) else 30.0,
+            'same_slot_pause_ms': _non_negative_int('vend_same_slot_pause_ms', 300),
+            'retry_delay_ms': _non_negative_int('vend_retry_delay_ms', 350),
+            'max_attempts_total': _non_negative_int('vend_max_attempts_total', 0),
+            'max_attempts_per_slot': _non_negative_int('vend_max_attempts_per_slot', 0),
+            'settle_sec': settle_sec,
+        }
+
+    def _pulse_slot_and_confirm(self, tag, host, slot_number, item_name, settings, progress):
+        """Run one spring rotation on slot_number and return True once it is confirmed.
+
+        Shared by vend_slots_for and vend_cart_items_organized, which keep
+        their own retry and ordering rules. `tag` prefixes the log lines and
+        `progress` describes where this rotation sits in the caller's plan.
+        """
+        pulse_timeout_ms = settings['pulse_timeout_ms']
+        dispense_timeout = settings['dispense_timeout']
+        try:
+            with self._vend_lock:
+                _vend_log.info('%s Pulsing slot %s (2-pulse rotation, failsafe=%sms) (item: %s, %s)', tag, slot_number, pulse_timeout_ms, item_name, progress)
+
+                # Start monitoring dispense for this slot if dispense monitor is available
+                if self.dispense_monitor:
+                    self._track_pending_dispense(slot_number, item_name)
+                    self.dispense_monitor.start_dispense(
+                        slot_id=slot_number,
+                        timeout=dispense_timeout,
+                        item_name=item_name,
+                        delay_timeout_start=True
+                    )
+                    _vend_log.info('%s IR sensor monitoring started for slot %s (timeout deferred until transaction end, %ss).', tag, slot_number, dispense_timeout)
+                else:
+                    _vend_log.warning('%s WARNING: Dispense monitor not available - no IR sensor verification', tag)
+
+                try:
+                    # ESP32 controls the MUX boards for slots 1-40. No STATUS probe
+                    # first: the completion wait below polls STATUS anyway.
+
+                    # Attempt pulse and validate response.
+                    # Do not retry here: PULSE is non-idempotent and a delayed/lost ACK
+                    # can otherwise cause an unintended extra rotation.
+                    result = None
+                    try:
+                        result = pulse_slot(host, slot_number, pulse_timeout_ms, timeout=3.0)
+                        _vend_log.debug('%s Pulse response: %s', tag, result)
+                    except Exception as e:
+                        _vend_log.warning('%s WARNING: pulse_slot raised: %s', tag, e)
+                    if _esp32_reply_ok(result):
+                        _vend_log.info('%s SUCCESS: Pulse sent to ESP32 for slot %s, response: %s', tag, slot_number, result)
+                    else:
+                        _vend_log.warning('%s WARNING: pulse response not OK for slot %s; monitoring completion without retry', tag, slot_number)
+                        _vend_log.error('%s ERROR: ESP32 did not confirm pulse for slot %s. Response: %s', tag, slot_number, result)
+                    # Wait for firmware to finish the rotation (2 limit pulses).
+                    # Balance slow slots vs. long stalls.
+                    wait_timeout_sec = max(6.0, min(12.0, (pulse_timeout_ms / 1000.0) + 3.0))
+                    completed = self._wait_for_slot_rotation_complete(
+                        host=host,
+                        slot_number=slot_number,
+                        timeout_sec=wait_timeout_sec
+                    )
+                    if completed:
+                        _vend_log.info('%s Slot %s rotation complete (2 pulses detected).', tag, slot_number)
+                        return True
+                    _vend_log.warning('%s WARNING: Slot %s completion not confirmed before timeout.', tag, slot_number)
+                except Exception as e:
+                    _vend_log.exception('%s CRITICAL ERROR: Failed to send pulse for slot %s: %s', tag, slot_number, e)
+                    _vend_log.debug('%s   Slot: %s', tag, slot_number)
+                    _vend_log.debug('%s   Rotation failsafe: %sms', tag, pulse_timeout_ms)
+        except Exception as e:
+            _vend_log.exception('%s CRITICAL ERROR: Exception vending slot %s: %s', tag, slot_number, e)
+        return False
+
     def vend_slots_for(self, item_name, quantity=1, preferred_slot=None):
         """Find assigned slots for item_name and pulse the ESP32 outputs.
 
@@ -1828,90 +2256,45 @@ class MainApp(tk.Tk):
         
         Also monitors dispensing using IR sensors if dispense monitor is available.
         """
-        assigned = getattr(self, 'assigned_slots', None)
+        assigned = self.assigned_slots
         if not assigned:
-            print('[VEND] ERROR: No assigned_slots available to vend from')
+            _vend_log.error('[VEND] ERROR: No assigned_slots available to vend from')
             return
-        # find matching indices (1-based slot numbers)
-        matches = []
-        for idx, slot in enumerate(assigned):
-            if not slot:
-                continue
-
-            # Legacy single-slot format: {'name': 'Item Name', ...}
-            if isinstance(slot, dict) and slot.get('name'):
-                if slot.get('name') == item_name:
-                    matches.append(idx+1)
-                    continue
-
-            # New 'terms' format: slot contains a list under 'terms' for multiple
-            # display terms. Use the currently selected `assigned_term` index
-            # (default 0) to pick the active term for comparison.
-            if isinstance(slot, dict) and 'terms' in slot:
-                terms = slot.get('terms', [])
-                term_idx = getattr(self, 'assigned_term', 0) or 0
-                if isinstance(terms, list) and len(terms) > term_idx:
-                    term_entry = terms[term_idx]
-                    if isinstance(term_entry, dict):
-                        term_name = term_entry.get('name')
-                        if term_name and term_name == item_name:
-                            matches.append(idx+1)
-                            continue
+        # find matching indices (1-based slot numbers): legacy {'name': ...}
+        # slots and the active `assigned_term` entry of 'terms' slots
+        matches = self._assigned_slot_numbers(item_name)
         if not matches:
-            print(f'[VEND] ERROR: No physical slots assigned for item "{item_name}"')
-            print(f'[VEND] Available slots: {[s.get("name") if isinstance(s, dict) else None for s in assigned]}')
+            _vend_log.error('[VEND] ERROR: No physical slots assigned for item "%s"', item_name)
+            if _vend_log.isEnabledFor(logging.DEBUG):
+                _vend_log.debug('[VEND] Available slots: %s', [s.get("name") if isinstance(s, dict) else None for s in assigned])
             return
-        host = self.config.get('esp32_host') if isinstance(self.config, dict) else None
-        if not host:
-            host = '192.168.4.1'  # common AP fallback; set in config for your network
-        pulse_timeout_ms = 15000  # Failsafe timeout; normal stop is 2 limit-switch pulses
-        try:
-            pulse_timeout_ms = int(
-                self.config.get('hardware', {}).get('vend_rotation_failsafe_ms', 15000)
-            ) if isinstance(self.config, dict) else 15000
-        except Exception:
-            pulse_timeout_ms = 15000
-        
-        # Get dispense timeout from config
-        dispense_timeout = self.config.get('hardware', {}).get('ir_sensors', {}).get('dispense_timeout', 30.0) if isinstance(self.config, dict) else 30.0
-        try:
-            same_slot_pause_ms = int(self.config.get('hardware', {}).get('vend_same_slot_pause_ms', 300))
-        except Exception:
-            same_slot_pause_ms = 300
-        if same_slot_pause_ms < 0:
-            same_slot_pause_ms = 0
+        settings = self._vend_settings()
+        host = settings['host']
+        pulse_timeout_ms = settings['pulse_timeout_ms']
+        same_slot_pause_ms = settings['same_slot_pause_ms']
+        retry_delay_ms = settings['retry_delay_ms']
+        max_attempts = settings['max_attempts_total']
+        settle_sec = settings['settle_sec']
         
         selected_matches = list(matches)
         try:
             pref_slot = int(preferred_slot) if preferred_slot is not None else None
             if pref_slot and pref_slot in matches:
                 selected_matches = [pref_slot]
-                print(f'[VEND] Preferred slot {pref_slot} selected for "{item_name}"')
+                _vend_log.info('[VEND] Preferred slot %s selected for "%s"', pref_slot, item_name)
             elif pref_slot:
-                print(f'[VEND] WARNING: Preferred slot {pref_slot} is not assigned for "{item_name}", using mapped slots {matches}')
+                _vend_log.warning('[VEND] WARNING: Preferred slot %s is not assigned for "%s", using mapped slots %s', pref_slot, item_name, matches)
         except Exception:
             pass
 
-        print(f'[VEND] Found {len(selected_matches)} slot(s) for "{item_name}": {selected_matches}')
-        print(f'[VEND] Using ESP32 host: {host}, rotation_failsafe_ms: {pulse_timeout_ms}')
-        try:
-            retry_delay_ms = int(self.config.get('hardware', {}).get('vend_retry_delay_ms', 350))
-        except Exception:
-            retry_delay_ms = 350
-        if retry_delay_ms < 0:
-            retry_delay_ms = 0
-        try:
-            max_attempts = int(self.config.get('hardware', {}).get('vend_max_attempts_total', 0))
-        except Exception:
-            max_attempts = 0
-        if max_attempts < 0:
-            max_attempts = 0
+        _vend_log.info('[VEND] Found %s slot(s) for "%s": %s', len(selected_matches), item_name, selected_matches)
+        _vend_log.info('[VEND] Using ESP32 host: %s, rotation_failsafe_ms: %s', host, pulse_timeout_ms)
         try:
             target_quantity = int(quantity)
         except Exception:
             target_quantity = 1
         if target_quantity <= 0:
-            print(f'[VEND] No quantity requested for "{item_name}".')
+            _vend_log.info('[VEND] No quantity requested for "%s".', item_name)
             return
         
         # Round-robin distribute pulses and keep retrying until required quantity is met.
@@ -1921,103 +2304,34 @@ class MainApp(tk.Tk):
             slot_number = selected_matches[successful_dispenses % len(selected_matches)]
             total_attempts += 1
             if max_attempts > 0 and total_attempts > max_attempts:
-                print(f'[VEND] ERROR: Reached max attempts ({max_attempts}) for "{item_name}" at {successful_dispenses}/{target_quantity}.')
+                _vend_log.error('[VEND] ERROR: Reached max attempts (%s) for "%s" at %s/%s.', max_attempts, item_name, successful_dispenses, target_quantity)
                 break
-            dispense_completed = False
-            try:
-                with self._vend_lock:
-                    print(f'[VEND] Pulsing slot {slot_number} (2-pulse rotation, failsafe={pulse_timeout_ms}ms) (item: {item_name}, quantity item {successful_dispenses+1}/{target_quantity}, attempt {total_attempts})')
-                    
-                    # Start monitoring dispense for this slot if dispense monitor is available
-                    if self.dispense_monitor:
-                        self._track_pending_dispense(slot_number, item_name)
-                        self.dispense_monitor.start_dispense(
-                            slot_id=slot_number,
-                            timeout=dispense_timeout,
-                            item_name=item_name,
-                            delay_timeout_start=True
-                        )
-                        print(f'[VEND] IR sensor monitoring started for slot {slot_number} (timeout deferred until transaction end, {dispense_timeout}s).')
-                    else:
-                        print(f'[VEND] WARNING: Dispense monitor not available - no IR sensor verification')
-                    
-                    try:
-                        # ESP32 controls the MUX boards for slots 1-40
-                        from esp32_client import send_command, pulse_slot
-                        try:
-                            # quick STATUS check
-                            status_resp = send_command(host, "STATUS", timeout=1.0)
-                            print(f'[VEND] ESP32 STATUS: {status_resp}')
-                            # small settle time before pulsing
-                            time.sleep(0.05)
-                        except Exception as e:
-                            print(f'[VEND] WARNING: ESP32 STATUS check failed: {e}')
-
-                        # Attempt pulse and validate response.
-                        # Do not retry here: PULSE is non-idempotent and a delayed/lost ACK
-                        # can otherwise cause an unintended extra rotation.
-                        result = None
-                        try:
-                            result = pulse_slot(host, slot_number, pulse_timeout_ms, timeout=3.0)
-                            print(f'[VEND] Pulse response: {result}')
-                        except Exception as e:
-                            print(f'[VEND] WARNING: pulse_slot raised: {e}')
-                        if not result or "OK" not in str(result).upper():
-                            print(f'[VEND] WARNING: pulse response not OK for slot {slot_number}; monitoring completion without retry')
-
-                        if result and "OK" in str(result).upper():
-                            print(f'[VEND] SUCCESS: Pulse sent to ESP32 for slot {slot_number}, response: {result}')
-                        else:
-                            print(f'[VEND] ERROR: ESP32 did not confirm pulse for slot {slot_number}. Response: {result}')
-                        # Wait for firmware to finish the rotation (2 limit pulses).
-                        # Balance slow slots vs. long stalls.
-                        wait_timeout_sec = max(6.0, min(12.0, (pulse_timeout_ms / 1000.0) + 3.0))
-                        completed = self._wait_for_slot_rotation_complete(
-                            host=host,
-                            slot_number=slot_number,
-                            timeout_sec=wait_timeout_sec
-                        )
-                        if completed:
-                            print(f'[VEND] Slot {slot_number} rotation complete (2 pulses detected).')
-                            dispense_completed = True
-                        else:
-                            print(f'[VEND] WARNING: Slot {slot_number} completion not confirmed before timeout.')
-                    except Exception as e:
-                        print(f'[VEND] CRITICAL ERROR: Failed to send pulse for slot {slot_number}: {e}')
-                        print(f'[VEND]   Slot: {slot_number}')
-                        print(f'[VEND]   Rotation failsafe: {pulse_timeout_ms}ms')
-                        import traceback
-                        traceback.print_exc()
-            except Exception as e:
-                print(f'[VEND] CRITICAL ERROR: Exception vending slot {slot_number}: {e}')
-                import traceback
-                traceback.print_exc()
+            dispense_completed = self._pulse_slot_and_confirm(
+                '[VEND]', host, slot_number, item_name, settings,
+                f'quantity item {successful_dispenses+1}/{target_quantity}, attempt {total_attempts}',
+            )
 
             if dispense_completed:
                 successful_dispenses += 1
             else:
-                print(f'[VEND] RETRY: "{item_name}" still at {successful_dispenses}/{target_quantity}.')
+                _vend_log.info('[VEND] RETRY: "%s" still at %s/%s.', item_name, successful_dispenses, target_quantity)
                 if retry_delay_ms > 0:
                     time.sleep(retry_delay_ms / 1000.0)
                 continue
 
             # Apply a brief stop between repeated rotations on the same slot.
             if len(selected_matches) == 1 and successful_dispenses < target_quantity and same_slot_pause_ms > 0:
-                print(f'[VEND] Same-slot pause: {same_slot_pause_ms}ms before next rotation on slot {slot_number}.')
+                _vend_log.info('[VEND] Same-slot pause: %sms before next rotation on slot %s.', same_slot_pause_ms, slot_number)
                 time.sleep(same_slot_pause_ms / 1000.0)
 
             # Small settle delay to keep MUX switching safe between pulses
-            try:
-                settle_ms = int(self.config.get('hardware', {}).get('vend_settle_ms', 200))
-                if settle_ms > 0:
-                    time.sleep(settle_ms / 1000.0)
-            except Exception:
-                time.sleep(0.2)
+            if settle_sec > 0:
+                time.sleep(settle_sec)
 
         if successful_dispenses < target_quantity:
-            print(f'[VEND] INCOMPLETE: "{item_name}" dispensed {successful_dispenses}/{target_quantity}.')
+            _vend_log.info('[VEND] INCOMPLETE: "%s" dispensed %s/%s.', item_name, successful_dispenses, target_quantity)
         else:
-            print(f'[VEND] COMPLETE: "{item_name}" dispensed {successful_dispenses}/{target_quantity}.')
+            _vend_log.info('[VEND] COMPLETE: "%s" dispensed %s/%s.', item_name, successful_dispenses, target_quantity)
         self._arm_transaction_dispense_timeouts()
 
     def vend_cart_items_organized(self, cart_items):
@@ -2034,15 +2348,15 @@ class MainApp(tk.Tk):
             cart_items (list): List of dicts with 'item' (item object) and 'quantity' (int)
         """
         if not cart_items:
-            print('[VEND-ORG] ERROR: No items to vend')
+            _vend_log.error('[VEND-ORG] ERROR: No items to vend')
             return
             
-        assigned = getattr(self, 'assigned_slots', None)
+        assigned = self.assigned_slots
         if not assigned:
-            print('[VEND-ORG] ERROR: No assigned_slots available to vend from')
+            _vend_log.error('[VEND-ORG] ERROR: No assigned_slots available to vend from')
             return
         
-        # Build a mapping: slot_number -> list of (item_name, quantity) tuples
+        # Build a mapping: slot_number -> list of item names, one entry per dispense
         slot_to_items = {}
         
         for item_entry in cart_items:
@@ -2051,45 +2365,24 @@ class MainApp(tk.Tk):
                 qty = int(item_entry.get('quantity', 1)) if isinstance(item_entry, dict) else 1
                 
                 if not item_obj or not item_obj.get('name'):
-                    print(f'[VEND-ORG] WARNING: Invalid item entry: {item_entry}')
+                    _vend_log.warning('[VEND-ORG] WARNING: Invalid item entry: %s', item_entry)
                     continue
                     
                 item_name = item_obj.get('name')
                 preferred_slot = self._item_slot_number(item_obj) if isinstance(item_obj, dict) else None
                 
                 # Find all slots assigned to this item
-                item_slots = []
-                for idx, slot in enumerate(assigned):
-                    if not slot:
-                        continue
-                    
-                    # Legacy single-slot format
-                    if isinstance(slot, dict) and slot.get('name'):
-                        if slot.get('name') == item_name:
-                            item_slots.append(idx + 1)
-                            continue
-                    
-                    # New 'terms' format
-                    if isinstance(slot, dict) and 'terms' in slot:
-                        terms = slot.get('terms', [])
-                        term_idx = getattr(self, 'assigned_term', 0) or 0
-                        if isinstance(terms, list) and len(terms) > term_idx:
-                            term_entry = terms[term_idx]
-                            if isinstance(term_entry, dict):
-                                term_name = term_entry.get('name')
-                                if term_name and term_name == item_name:
-                                    item_slots.append(idx + 1)
-                                    continue
+                item_slots = self._assigned_slot_numbers(item_name)
                 
                 if not item_slots:
-                    print(f'[VEND-ORG] ERROR: No physical slots assigned for item "{item_name}"')
+                    _vend_log.error('[VEND-ORG] ERROR: No physical slots assigned for item "%s"', item_name)
                     continue
 
                 # If checkout item came from a specific tray, keep dispensing on that tray.
                 try:
                     if preferred_slot and preferred_slot in item_slots:
                         item_slots = [preferred_slot]
-                        print(f'[VEND-ORG] Preferred slot {preferred_slot} selected for "{item_name}"')
+                        _vend_log.info('[VEND-ORG] Preferred slot %s selected for "%s"', preferred_slot, item_name)
                 except Exception:
                     pass
                 
@@ -2097,64 +2390,34 @@ class MainApp(tk.Tk):
                 # If item is in multiple slots, distribute quantities round-robin
                 for i in range(qty):
                     slot_num = item_slots[i % len(item_slots)]
-                    if slot_num not in slot_to_items:
-                        slot_to_items[slot_num] = []
-                    slot_to_items[slot_num].append({
-                        'name': item_name,
-                        'count': 1  # Each entry represents 1 dispense
-                    })
+                    slot_to_items.setdefault(slot_num, []).append(item_name)
                     
-                print(f'[VEND-ORG] Item "{item_name}" (qty: {qty}) assigned to slots: {item_slots}')
+                _vend_log.info('[VEND-ORG] Item "%s" (qty: %s) assigned to slots: %s', item_name, qty, item_slots)
                     
             except Exception as e:
-                print(f'[VEND-ORG] ERROR processing item entry: {e}')
-                import traceback
-                traceback.print_exc()
+                _vend_log.exception('[VEND-ORG] ERROR processing item entry: %s', e)
                 continue
         
         if not slot_to_items:
-            print('[VEND-ORG] ERROR: No items could be mapped to slots')
+            _vend_log.error('[VEND-ORG] ERROR: No items could be mapped to slots')
             return
         
         # Sort slots in ascending order
         sorted_slots = sorted(slot_to_items.keys())
-        print(f'[VEND-ORG] Dispensing from slots in order: {sorted_slots}')
-        print(f'[VEND-ORG] Slot-to-items mapping: {slot_to_items}')
+        _vend_log.info('[VEND-ORG] Dispensing from slots in order: %s', sorted_slots)
+        if _vend_log.isEnabledFor(logging.DEBUG):
+            _vend_log.debug('[VEND-ORG] Slot-to-items mapping: %s', slot_to_items)
         
-        host = self.config.get('esp32_host') if isinstance(self.config, dict) else None
-        if not host:
-            host = '192.168.4.1'
-        pulse_timeout_ms = 15000  # Failsafe timeout; normal stop is 2 limit-switch pulses
-        try:
-            pulse_timeout_ms = int(
-                self.config.get('hardware', {}).get('vend_rotation_failsafe_ms', 15000)
-            ) if isinstance(self.config, dict) else 15000
-        except Exception:
-            pulse_timeout_ms = 15000
-        
-        # Get dispense timeout from config
-        dispense_timeout = self.config.get('hardware', {}).get('ir_sensors', {}).get('dispense_timeout', 30.0) if isinstance(self.config, dict) else 30.0
-        try:
-            same_slot_pause_ms = int(self.config.get('hardware', {}).get('vend_same_slot_pause_ms', 300))
-        except Exception:
-            same_slot_pause_ms = 300
-        if same_slot_pause_ms < 0:
-            same_slot_pause_ms = 0
-        try:
-            retry_delay_ms = int(self.config.get('hardware', {}).get('vend_retry_delay_ms', 350))
-        except Exception:
-            retry_delay_ms = 350
-        if retry_delay_ms < 0:
-            retry_delay_ms = 0
-        try:
-            max_attempts_per_slot = int(self.config.get('hardware', {}).get('vend_max_attempts_per_slot', 0))
-        except Exception:
-            max_attempts_per_slot = 0
+        settings = self._vend_settings()
+        host = settings['host']
+        pulse_timeout_ms = settings['pulse_timeout_ms']
+        same_slot_pause_ms = settings['same_slot_pause_ms']
+        retry_delay_ms = settings['retry_delay_ms']
         # Interpret as max failed attempts per slot; 0 = unlimited retries.
-        if max_attempts_per_slot < 0:
-            max_attempts_per_slot = 0
+        max_attempts_per_slot = settings['max_attempts_per_slot']
+        settle_sec = settings['settle_sec']
         
-        print(f'[VEND-ORG] Using ESP32 host: {host}, rotation_failsafe_ms: {pulse_timeout_ms}')
+        _vend_log.info('[VEND-ORG] Using ESP32 host: %s, rotation_failsafe_ms: %s', host, pulse_timeout_ms)
         
         # Dispense each slot completely before moving to the next.
         # Only move forward when required count is confirmed for the current slot.
@@ -2168,80 +2431,14 @@ class MainApp(tk.Tk):
             required_for_slot = len(items_for_slot)
             dispensed_for_slot = 0
             failures_for_slot = 0
-            print(f'[VEND-ORG] Processing slot {slot_number}: required {required_for_slot} item(s)')
+            _vend_log.info('[VEND-ORG] Processing slot %s: required %s item(s)', slot_number, required_for_slot)
 
             while dispensed_for_slot < required_for_slot:
-                item_entry = items_for_slot[dispensed_for_slot]
-                item_name = item_entry.get('name', 'Unknown')
-                dispense_completed = False
-                try:
-                    with self._vend_lock:
-                        print(f'[VEND-ORG] Pulsing slot {slot_number} (2-pulse rotation, failsafe={pulse_timeout_ms}ms) (item: {item_name}, dispense {dispensed_for_slot+1}/{required_for_slot}, failures {failures_for_slot})')
-
-                        # Start monitoring dispense for this slot if available
-                        if self.dispense_monitor:
-                            self._track_pending_dispense(slot_number, item_name)
-                            self.dispense_monitor.start_dispense(
-                                slot_id=slot_number,
-                                timeout=dispense_timeout,
-                                item_name=item_name,
-                                delay_timeout_start=True
-                            )
-                            print(f'[VEND-ORG] IR sensor monitoring started for slot {slot_number} (timeout deferred until transaction end, {dispense_timeout}s).')
-                        else:
-                            print(f'[VEND-ORG] WARNING: Dispense monitor not available - no IR sensor verification')
-
-                        try:
-                            # ESP32 controls the MUX boards for slots 1-40
-                            from esp32_client import send_command, pulse_slot
-                            try:
-                                # Quick STATUS check
-                                status_resp = send_command(host, "STATUS", timeout=1.0)
-                                print(f'[VEND-ORG] ESP32 STATUS: {status_resp}')
-                                # Small settle time before pulsing
-                                time.sleep(0.05)
-                            except Exception as e:
-                                print(f'[VEND-ORG] WARNING: ESP32 STATUS check failed: {e}')
-
-                            # Attempt pulse and validate response
-                            result = None
-                            try:
-                                result = pulse_slot(host, slot_number, pulse_timeout_ms, timeout=3.0)
-                                print(f'[VEND-ORG] Pulse response: {result}')
-                            except Exception as e:
-                                print(f'[VEND-ORG] WARNING: pulse_slot raised: {e}')
-
-                            # Do not retry here: PULSE is non-idempotent and a delayed/lost ACK
-                            # can otherwise cause an unintended extra rotation.
-                            if not result or "OK" not in str(result).upper():
-                                print(f'[VEND-ORG] WARNING: pulse response not OK for slot {slot_number}; monitoring completion without retry')
-
-                            if result and "OK" in str(result).upper():
-                                print(f'[VEND-ORG] SUCCESS: Pulse sent to ESP32 for slot {slot_number}, response: {result}')
-                            else:
-                                print(f'[VEND-ORG] ERROR: ESP32 did not confirm pulse for slot {slot_number}. Response: {result}')
-                            # Wait for firmware to finish the rotation (2 limit pulses).
-                            # Balance slow slots vs. fast retries.
-                            wait_timeout_sec = max(6.0, min(12.0, (pulse_timeout_ms / 1000.0) + 3.0))
-                            completed = self._wait_for_slot_rotation_complete(
-                                host=host,
-                                slot_number=slot_number,
-                                timeout_sec=wait_timeout_sec
-                            )
-                            if completed:
-                                print(f'[VEND-ORG] Slot {slot_number} rotation complete (2 pulses detected).')
-                                dispense_completed = True
-                            else:
-                                print(f'[VEND-ORG] WARNING: Slot {slot_number} completion not confirmed before timeout.')
-                        except Exception as e:
-                            print(f'[VEND-ORG] CRITICAL ERROR: Failed to send pulse for slot {slot_number}: {e}')
-                            import traceback
-                            traceback.print_exc()
-
-                except Exception as e:
-                    print(f'[VEND-ORG] CRITICAL ERROR: Exception vending slot {slot_number}: {e}')
-                    import traceback
-                    traceback.print_exc()
+                item_name = items_for_slot[dispensed_for_slot]
+                dispense_completed = self._pulse_slot_and_confirm(
+                    '[VEND-ORG]', host, slot_number, item_name, settings,
+                    f'dispense {dispensed_for_slot+1}/{required_for_slot}, failures {failures_for_slot}',
+                )
 
                 if dispense_completed:
                     dispensed_for_slot += 1
@@ -2255,47 +2452,39 @@ class MainApp(tk.Tk):
                 else:
                     failures_for_slot += 1
                     if max_attempts_per_slot > 0 and failures_for_slot >= max_attempts_per_slot:
-                        print(f'[VEND-ORG] ERROR: Slot {slot_number} hit max failed attempts ({max_attempts_per_slot}) at {dispensed_for_slot}/{required_for_slot}.')
+                        _vend_log.error('[VEND-ORG] ERROR: Slot %s hit max failed attempts (%s) at %s/%s.', slot_number, max_attempts_per_slot, dispensed_for_slot, required_for_slot)
                         break
-                    print(f'[VEND-ORG] RETRY: Slot {slot_number} still at {dispensed_for_slot}/{required_for_slot}. Failed attempts: {failures_for_slot}')
+                    _vend_log.info('[VEND-ORG] RETRY: Slot %s still at %s/%s. Failed attempts: %s', slot_number, dispensed_for_slot, required_for_slot, failures_for_slot)
                     if retry_delay_ms > 0:
                         time.sleep(retry_delay_ms / 1000.0)
                     continue
 
                 # Same-slot multi-vend: stop briefly after each full rotation before next.
                 if dispensed_for_slot < required_for_slot and same_slot_pause_ms > 0:
-                    print(f'[VEND-ORG] Same-slot pause: {same_slot_pause_ms}ms before next rotation on slot {slot_number}.')
+                    _vend_log.info('[VEND-ORG] Same-slot pause: %sms before next rotation on slot %s.', same_slot_pause_ms, slot_number)
                     time.sleep(same_slot_pause_ms / 1000.0)
 
                 # Small settle delay to keep MUX switching safe between pulses
-                try:
-                    settle_ms = int(self.config.get('hardware', {}).get('vend_settle_ms', 200))
-                    if settle_ms > 0:
-                        time.sleep(settle_ms / 1000.0)
-                except Exception:
-                    time.sleep(0.2)
+                if settle_sec > 0:
+                    time.sleep(settle_sec)
 
-            print(f'[VEND-ORG] Slot {slot_number} summary: {dispensed_for_slot}/{required_for_slot} dispensed with {failures_for_slot} failure(s).')
+            _vend_log.info('[VEND-ORG] Slot %s summary: %s/%s dispensed with %s failure(s).', slot_number, dispensed_for_slot, required_for_slot, failures_for_slot)
             if dispensed_for_slot < required_for_slot:
                 remaining = required_for_slot - dispensed_for_slot
-                try:
-                    recovery_name = items_for_slot[dispensed_for_slot].get('name', 'Unknown')
-                except Exception:
-                    recovery_name = 'Unknown'
-                recovery_jobs.append((recovery_name, remaining, slot_number))
+                recovery_jobs.append((items_for_slot[dispensed_for_slot], remaining, slot_number))
 
         if total_dispensed < total_required:
-            print(f'[VEND-ORG] INCOMPLETE: Dispensed {total_dispensed}/{total_required} requested item(s).')
+            _vend_log.info('[VEND-ORG] INCOMPLETE: Dispensed %s/%s requested item(s).', total_dispensed, total_required)
         else:
-            print(f'[VEND-ORG] COMPLETE: Dispensed {total_dispensed}/{total_required} requested item(s).')
+            _vend_log.info('[VEND-ORG] COMPLETE: Dispensed %s/%s requested item(s).', total_dispensed, total_required)
         self._arm_transaction_dispense_timeouts()
 
         for rec_name, rec_qty, rec_slot in recovery_jobs:
             try:
-                print(f'[VEND-ORG] RECOVERY: attempting remaining {rec_qty} of {rec_name} on slot {rec_slot}')
+                _vend_log.info('[VEND-ORG] RECOVERY: attempting remaining %s of %s on slot %s', rec_qty, rec_name, rec_slot)
                 self.vend_slots_for(rec_name, quantity=rec_qty, preferred_slot=rec_slot)
             except Exception as e:
-                print(f'[VEND-ORG] Recovery vend failed for slot {rec_slot}: {e}')
+                _vend_log.error('[VEND-ORG] Recovery vend failed for slot %s: %s', rec_slot, e)
 
     def update_item(self, original_item_name, updated_item_data):
         """Update price/quantity in assigned slots, then refresh admin and kiosk views."""
@@ -2307,11 +2496,11 @@ class MainApp(tk.Tk):
             return
 
         slot_number = updated_item_data.get("_slot_number")
-        term_idx = getattr(self, "assigned_term", 0) or 0
+        term_idx = self.assigned_term or 0
         updated_in_slots = False
 
         # Primary path: update assigned slot data (source of truth for UI).
-        if isinstance(getattr(self, "assigned_slots", None), list) and self.assigned_slots:
+        if isinstance(self.assigned_slots, list) and self.assigned_slots:
             target_indices = []
             try:
                 if slot_number is not None:
@@ -2360,36 +2549,34 @@ class MainApp(tk.Tk):
                 # Rebuild flattened list used by Admin/Kiosk and keep legacy file in sync.
                 self.items = self._extract_items_from_slots(self.assigned_slots)
                 try:
-                    self.save_items_to_json()
+                    self._schedule_items_save()
                 except Exception:
                     pass
             else:
                 # Legacy fallback path.
-                for i, item in enumerate(self.items):
-                    if item.get("name") == original_item_name:
-                        merged = dict(item)
-                        merged.update(updated_item_data)
-                        merged["price"] = price_val
-                        merged["quantity"] = qty_val
-                        self.items[i] = merged
-                        break
-                self.save_items_to_json()
-
-        # Refresh UI views immediately.
-        try:
-            self.frames["AdminScreen"].populate_items()
-        except Exception:
-            pass
-        try:
-            self.frames["KioskFrame"].populate_items()
-        except Exception:
-            pass
+                i = self._find_item_index(original_item_name)
+                if i is not None:
+                    merged = dict(self.items[i])
+                    merged.update(updated_item_data)
+                    merged["price"] = price_val
+                    merged["quantity"] = qty_val
+                    self.items[i] = merged
+                self._schedule_items_save()
+
+        # Refresh UI views once the current event is done.
+        self._schedule_repaint("AdminScreen")
+        self._schedule_repaint("KioskFrame")
 
     def remove_item(self, item_to_remove):
         """Removes an item from the master list and saves to JSON."""
-        self.items.remove(item_to_remove)
-        self.save_items_to_json()
-        self.frames["AdminScreen"].populate_items()
+        pos = self._find_item_index(item_to_remove.get("name"))
+        if pos is not None and self.items[pos] is item_to_remove:
+            del self.items[pos]
+        else:
+            # Not the indexed entry (e.g. a copy or a duplicate name): match by value.
+            self.items.remove(item_to_remove)
+        self._schedule_items_save()
+        self._schedule_repaint("AdminScreen")
 
     def show_admin(self):
         self.show_frame("AdminScreen")
@@ -2426,6 +2613,8 @@ class MainApp(tk.Tk):
             self.show_frame("SelectionScreen")
         # Only exit app from SelectionScreen
         elif self.active_frame_name in ["SelectionScreen"]:
+            self._flush_items_save()
+            self._items_save_queue.join()
             self.destroy()
         else:
             # Safe default - go back to SelectionScreen
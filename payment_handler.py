@@ -1,4 +1,5 @@
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Timer
 from coin_hopper import CoinHopper
 import logging
 import platform
@@ -17,6 +18,31 @@ except Exception:
 
 logger = logging.getLogger(__name__)
 
+_IS_LINUX = platform.system() == 'Linux'
+
+
+def _skip_hardware(port, esp32_mode=False, esp32_host=None):
+    """Return True on a non-Linux dev host when ``port`` doesn't look like a real device."""
+    if _IS_LINUX or esp32_mode or esp32_host:
+        return False
+    p = str(port or '')
+    looks_like_serial = p.lower().startswith('com') or p.startswith('serial:') or ('tty' in p) or os.path.exists(p)
+    return not looks_like_serial
+
+
+def _to_centavos(amount):
+    """Convert a peso amount to whole centavos for exact comparisons."""
+    return int(round(float(amount) * 100))
+
+
+def _zero_amount():
+    return 0.0
+
+
+def _noop():
+    return None
+
+
 class SharedReaderCoinAcceptor:
     """Coin acceptor adapter backed by SharedSerialReader coin totals."""
     def __init__(self, shared_reader):
@@ -102,6 +128,13 @@ class SharedReaderCoinAcceptor:
 
 class PaymentHandler:
     """Payment handler that manages bill and coin acceptance, plus coin hopper dispensing."""
+    # Acceptor updates arriving within one frame are folded into a single UI callback.
+    _UPDATE_COALESCE_SEC = 0.016
+    # Change-status messages shown on the payment screen.
+    _CHANGE_DISPENSING = "Dispensing change: ₱%s"
+    _CHANGE_OK = "Change dispensed: ₱%s"
+    _CHANGE_ERR = "Error: %s"
+
     def __init__(self, config, coin_port=None, coin_baud=115200, bill_port=None,
                  bill_baud=None, bill_esp32_mode=False, bill_esp32_serial_port=None, bill_esp32_host=None, bill_esp32_port=5000,
                  coin_hopper_port=None, coin_hopper_baud=115200, use_gpio_coin=True, coin_gpio_pin=17):
@@ -123,6 +156,17 @@ class PaymentHandler:
             use_gpio_coin (bool): If True, use GPIO-based coin acceptor (Raspberry Pi)
             coin_gpio_pin (int): GPIO pin for coin acceptor (default 17)
         """
+        self._lock = Lock()
+        self._callback = None  # Optional callback for UI updates
+        self._change_callback = None  # Optional callback for change status
+        # Session totals pushed by the acceptor callbacks. get_current_amount()
+        # sums these without locking; the lock only guards session resets.
+        self._coin_total = 0.0
+        self._bill_total = 0.0
+        self._update_dirty = False
+        self._update_timer = None
+        self._flushing_update = False
+
         # Shared serial reader for Arduino Uno (DHT/IR/coin/bill) if enabled.
         # This avoids multiple consumers opening the same USB serial port.
         shared_reader = None
@@ -188,7 +232,6 @@ class PaymentHandler:
         
         # Ensure coin acceptor is initialized
         if not self.coin_acceptor:
-            print("WARNING: No coin acceptor available from Arduino shared serial")
             logger.warning("No coin acceptor available from Arduino shared serial")
         else:
             # Ensure payment UI receives push updates from coin acceptor in all modes.
@@ -203,21 +246,15 @@ class PaymentHandler:
         # configured port/host explicitly looks like a real device. This keeps
         # the UI usable during development without noisy error messages.
         self.bill_acceptor = None
-        run_platform = platform.system()
-        skip_hardware = False
-        # If running on non-Linux and the bill port doesn't look like COM or serial path, skip
-        if run_platform != 'Linux':
-            bp = str(bill_port or '')
-            looks_like_serial = bp.lower().startswith('com') or bp.startswith('serial:') or ('tty' in bp) or os.path.exists(bp)
-            if not looks_like_serial and not bill_esp32_mode and not (bill_esp32_host):
-                skip_hardware = True
+        skip_hardware = _skip_hardware(bill_port, bill_esp32_mode, bill_esp32_host)
 
         if BillAcceptor and not skip_hardware:
             try:
                 # Initialize bill acceptor with ESP32 proxy options when requested
                 # Choose sensible default baud: proxy/USB devices typically use 115200
                 if bill_baud is None:
-                    chosen_baud = 115200 if bill_esp32_mode or ('ttyACM' in str(bill_port) or 'ttyUSB' in str(bill_port)) else 9600
+                    bp = str(bill_port or '')
+                    chosen_baud = 115200 if bill_esp32_mode or 'ttyACM' in bp or 'ttyUSB' in bp else 9600
                 else:
                     chosen_baud = int(bill_baud)
 
@@ -230,57 +267,69 @@ class PaymentHandler:
                     esp32_port=bill_esp32_port,
                     shared_reader=shared_reader
                 )
-                print(f"DEBUG: BillAcceptor created (before connect)")
-                if self.bill_acceptor.connect():
-                    print(f"DEBUG: BillAcceptor connected successfully")
+                logger.debug("BillAcceptor created (before connect)")
+            except Exception as e:
+                logger.warning(f"Error initializing bill acceptor: {e}")
+                self.bill_acceptor = None
+        else:
+            if skip_hardware:
+                logger.info("Skipping bill acceptor initialization on non-Linux development host")
+            else:
+                logger.warning("BillAcceptor class not available")
+        
+        # Setup coin hoppers via serial to arduino_bill_forward
+        self.coin_hopper = None
+        # On non-Linux hosts, skip coin hopper unless the configured port looks like a real serial device
+        coin_skip = _skip_hardware(coin_hopper_port)
+
+        if not coin_skip:
+            try:
+                self.coin_hopper = CoinHopper(
+                    serial_port=coin_hopper_port,
+                    baudrate=coin_hopper_baud
+                )
+            except Exception as e:
+                logger.warning(f"Error initializing coin hoppers: {e}")
+                self.coin_hopper = None
+        else:
+            logger.info("Skipping coin hopper initialization on non-Linux development host")
+
+        # The bill acceptor and hopper handshakes are independent blocking
+        # serial/TCP opens, so run them side by side instead of back to back.
+        bill_fut = hopper_fut = None
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if self.bill_acceptor:
+                bill_fut = pool.submit(self.bill_acceptor.connect)
+            if self.coin_hopper:
+                hopper_fut = pool.submit(self.coin_hopper.connect)
+
+        if bill_fut is not None:
+            try:
+                if bill_fut.result():
+                    logger.debug("BillAcceptor connected successfully")
                     # Register callback to notify UI of bill updates
                     try:
                         # Register bill acceptor callback directly to PaymentHandler._on_bill_update
                         self.bill_acceptor.set_callback(self._on_bill_update)
                         logger.info("Bill acceptor callback registered")
-                        # Extra debug print to ensure callback registration is visible in logs
-                        print("DEBUG: PaymentHandler set BillAcceptor callback (direct)")
                     except Exception as e:
                         logger.warning(f"Could not register bill acceptor callback: {e}")
-                        print(f"DEBUG: Failed to set BillAcceptor callback: {e}")
                     
                     # Start reading bills
                     if self.bill_acceptor.start_reading():
-                        print(f"DEBUG: BillAcceptor reading started successfully")
                         logger.info("Bill acceptor reading started")
                     else:
-                        print(f"DEBUG: BillAcceptor failed to start reading")
+                        logger.warning("Bill acceptor failed to start reading")
                 else:
                     logger.warning("Bill acceptor connection failed")
-                    print(f"DEBUG: BillAcceptor connection failed")
                     self.bill_acceptor = None
             except Exception as e:
                 logger.warning(f"Error initializing bill acceptor: {e}")
-                print(f"DEBUG: Error initializing bill acceptor: {e}")
                 self.bill_acceptor = None
-        else:
-            if skip_hardware:
-                logger.info("Skipping bill acceptor initialization on non-Linux development host")
-            else:
-                print("DEBUG: BillAcceptor class not available")
-        
-        # Setup coin hoppers via serial to arduino_bill_forward
-        self.coin_hopper = None
-        # On non-Linux hosts, skip coin hopper unless the configured port looks like a real serial device
-        coin_skip = False
-        if run_platform != 'Linux':
-            cp = str(coin_hopper_port or '')
-            looks_like_serial = cp.lower().startswith('com') or cp.startswith('serial:') or ('tty' in cp) or os.path.exists(cp)
-            if not looks_like_serial:
-                coin_skip = True
 
-        if not coin_skip:
+        if hopper_fut is not None:
             try:
-                self.coin_hopper = CoinHopper(
-                    serial_port=coin_hopper_port,
-                    baudrate=coin_hopper_baud
-                )
-                if self.coin_hopper.connect():
+                if hopper_fut.result():
                     logger.info(f"Coin hopper connected to {coin_hopper_port} @ {coin_hopper_baud} baud")
                 else:
                     logger.warning(f"Coin hopper connection failed on {coin_hopper_port}")
@@ -288,12 +337,20 @@ class PaymentHandler:
             except Exception as e:
                 logger.warning(f"Error initializing coin hoppers: {e}")
                 self.coin_hopper = None
+
+        # Bind the acceptor accessors once so the session paths skip the None checks.
+        if self.coin_acceptor:
+            self._get_coin_amount = self.coin_acceptor.get_received_amount
+            self._reset_coin = self.coin_acceptor.reset_amount
         else:
-            logger.info("Skipping coin hopper initialization on non-Linux development host")
-            
-        self._lock = Lock()
-        self._callback = None  # Optional callback for UI updates
-        self._change_callback = None  # Optional callback for change status
+            self._get_coin_amount = _zero_amount
+            self._reset_coin = _noop
+        if self.bill_acceptor:
+            self._get_bill_amount = self.bill_acceptor.get_received_amount
+            self._reset_bill = self.bill_acceptor.reset_amount
+        else:
+            self._get_bill_amount = _zero_amount
+            self._reset_bill = _noop
 
     def start_payment_session(self, required_amount=None, on_payment_update=None, on_change_update=None):
         """Start a new payment session.
@@ -302,18 +359,12 @@ class PaymentHandler:
             required_amount (float, optional): Target amount to collect
             on_payment_update (callable, optional): Callback(amount) when coins received
         """
+        self._cancel_update()
         self._callback = on_payment_update
         # Optional callback for change-dispense status messages
         self._change_callback = on_change_update
-        # Debug: show that start_payment_session set the callback
-        try:
-            print(f"DEBUG: PaymentHandler.start_payment_session: callback set = {bool(self._callback)}")
-        except Exception:
-            pass
-        if self.coin_acceptor:
-            self.coin_acceptor.reset_amount()
-        if self.bill_acceptor:
-            self.bill_acceptor.reset_amount()
+        logger.debug("start_payment_session: callback set = %s", bool(self._callback))
+        self._reset_totals()
         # Safety: hopper relays must be off unless actively dispensing change.
         if self.coin_hopper:
             try:
@@ -327,47 +378,96 @@ class PaymentHandler:
 
         We forward combined total (coins + bills) to the UI callback if set.
         """
-        # Debug: incoming bill update
-        try:
-            print(f"DEBUG: PaymentHandler._on_bill_update received bill_total_amount={bill_total_amount}, current_total={self.get_current_amount()}, callback_present={bool(self._callback)}")
-        except Exception:
-            pass
-
-        if self._callback:
+        # Bill events are dispatched from a queue, so re-read the acceptor
+        # rather than trusting a total that may predate a session reset.
+        with self._lock:
             try:
-                self._callback(self.get_current_amount())
-            except Exception as e:
-                print(f"DEBUG: PaymentHandler._on_bill_update callback error: {e}")
-                pass
+                self._bill_total = float(self._get_bill_amount())
+            except Exception:
+                self._bill_total = float(bill_total_amount or 0.0)
+        logger.debug("_on_bill_update received bill_total_amount=%s, current_total=%s, callback_present=%s",
+                     bill_total_amount, self.get_current_amount(), bool(self._callback))
+
+        self._request_update()
 
     def _on_coin_update(self, coin_total_amount):
         """Internal callback invoked when coin acceptor reports an update.
 
         We forward combined total (coins + bills) to the UI callback if set.
         """
-        # Debug: incoming coin update
-        try:
-            print(f"DEBUG: PaymentHandler._on_coin_update received coin_total_amount={coin_total_amount}, current_total={self.get_current_amount()}, callback_present={bool(self._callback)}")
-        except Exception:
-            pass
-
-        if self._callback:
+        # The acceptor computes the amount before we take the lock, so re-read
+        # it; a callback in flight during a reset must not restore the old total.
+        with self._lock:
             try:
-                self._callback(self.get_current_amount())
-            except Exception as e:
-                print(f"DEBUG: PaymentHandler._on_coin_update callback error: {e}")
-                pass
+                self._coin_total = float(self._get_coin_amount())
+            except Exception:
+                try:
+                    self._coin_total = float(coin_total_amount)
+                except Exception:
+                    pass
+        logger.debug("_on_coin_update received coin_total_amount=%s, current_total=%s, callback_present=%s",
+                     coin_total_amount, self.get_current_amount(), bool(self._callback))
+
+        self._request_update()
+
+    def _request_update(self):
+        """Mark the totals dirty and arm a one-shot flush if none is pending."""
+        with self._lock:
+            self._update_dirty = True
+            if self._update_timer is not None or self._flushing_update:
+                return
+            timer = Timer(self._UPDATE_COALESCE_SEC, self._flush_update)
+            timer.daemon = True
+            self._update_timer = timer
+        timer.start()
+
+    def _flush_update(self):
+        """Deliver the latest combined total to the UI callback at most once per frame."""
+        with self._lock:
+            self._update_timer = None
+            if not self._update_dirty:
+                return
+            self._update_dirty = False
+            self._flushing_update = True
+            callback = self._callback
+        try:
+            if callback:
+                try:
+                    callback(self.get_current_amount())
+                except Exception as e:
+                    logger.warning(f"Payment update callback error: {e}")
+        finally:
+            with self._lock:
+                self._flushing_update = False
+                pending = self._update_dirty
+            # Updates that landed during the callback get their own flush.
+            if pending:
+                self._request_update()
+
+    def _cancel_update(self):
+        """Drop any pending coalesced UI update."""
+        with self._lock:
+            timer = self._update_timer
+            self._update_timer = None
+            self._update_dirty = False
+        if timer is not None:
+            timer.cancel()
 
     def get_current_amount(self):
-        """Get the total amount received in the current session."""
+        """Get the total amount received in the current session.
+
+        Reads the totals cached by the acceptor callbacks, so polling this
+        from the UI never blocks on the lock or the acceptor drivers.
+        """
+        return self._coin_total + self._bill_total
+
+    def _reset_totals(self):
+        """Zero the acceptor counters and the cached session totals together."""
         with self._lock:
-            coin_amount = 0.0
-            if self.coin_acceptor:
-                coin_amount = self.coin_acceptor.get_received_amount()
-            bill_amount = 0.0
-            if self.bill_acceptor:
-                bill_amount = self.bill_acceptor.get_received_amount()
-            return coin_amount + bill_amount
+            self._reset_coin()
+            self._reset_bill()
+            self._coin_total = 0.0
+            self._bill_total = 0.0
 
     def stop_payment_session(self, required_amount=None):
         """Stop the current payment session and handle change if needed.
@@ -378,112 +478,100 @@ class PaymentHandler:
         Returns:
             Tuple of (total_received, change_amount, change_status)
         """
-        coin_received = 0.0
-        if self.coin_acceptor:
-            coin_received = self.coin_acceptor.get_received_amount()
-        bill_received = 0.0
-        if self.bill_acceptor:
-            bill_received = self.bill_acceptor.get_received_amount()
+        hopper = self.coin_hopper
+        shared = self._shared_reader
+        change_cb = self._change_callback
+        coin_received = self._get_coin_amount()
+        bill_received = self._get_bill_amount()
         
         total_received = coin_received + bill_received
         change_amount = 0
         change_status = ""
         
-        # Calculate change if needed
-        if required_amount is not None and total_received > required_amount:
-            change_needed = total_received - required_amount
+        # Calculate change if needed, comparing whole centavos so float sums
+        # (e.g. 1.1 + 2.2) can't register a phantom overpayment.
+        change_centavos = 0
+        if required_amount is not None:
+            change_centavos = _to_centavos(total_received) - _to_centavos(required_amount)
+        if change_centavos > 0:
             # Round to nearest whole peso and ensure non-negative integer
-            try:
-                change_int = int(round(change_needed))
-            except Exception:
-                change_int = int(change_needed)
-            if change_int <= 0:
-                change_int = 0
-            if change_int > 0 and self.coin_hopper:
+            change_int = max(0, int(round(change_centavos / 100)))
+            if change_int > 0 and hopper:
                 shared_suspended = False
-                if self._shared_reader and hasattr(self._shared_reader, "suspend"):
+                if shared and hasattr(shared, "suspend"):
                     try:
-                        self._shared_reader.suspend()
+                        shared.suspend()
                         shared_suspended = True
                     except Exception:
                         shared_suspended = False
-                if self._change_callback:
+                if change_cb:
                     try:
-                        self._change_callback(f"Dispensing change: ₱{change_int}")
+                        change_cb(self._CHANGE_DISPENSING % change_int)
                     except Exception:
                         pass
                 # Keep UI responsive: short fallback timeout if serial DONE/ERR lines
                 # are missed even when coins were physically dispensed.
                 try:
-                    success, dispensed, message = self.coin_hopper.dispense_change(
+                    success, dispensed, message = hopper.dispense_change(
                         change_int,
                         timeout_ms=8000,
-                        callback=self._change_callback
+                        callback=change_cb
                     )
                 finally:
-                    if shared_suspended and hasattr(self._shared_reader, "resume"):
+                    if shared_suspended and hasattr(shared, "resume"):
                         try:
-                            self._shared_reader.resume()
+                            shared.resume()
                         except Exception:
                             pass
                 if success:
                     change_amount = dispensed
-                    change_status = f"Change dispensed: ₱{dispensed}"
-                    if self._change_callback:
-                        try:
-                            self._change_callback(change_status)
-                        except Exception:
-                            pass
+                    change_status = self._CHANGE_OK % dispensed
                 else:
                     # Preserve partial dispense amount so UI reflects actual output.
                     try:
                         change_amount = max(0, int(dispensed))
                     except Exception:
                         change_amount = 0
-                    change_status = f"Error: {message}"
-                    if self._change_callback:
-                        try:
-                            self._change_callback(change_status)
-                        except Exception:
-                            pass
+                    change_status = self._CHANGE_ERR % (message,)
             else:
                 change_status = "Change dispenser not available"
-                if self._change_callback:
-                    try:
-                        self._change_callback(change_status)
-                    except Exception:
-                        pass
-        if self.coin_acceptor:
-            self.coin_acceptor.reset_amount()
-        if self.bill_acceptor:
-            self.bill_acceptor.reset_amount()
+            if change_cb:
+                try:
+                    change_cb(change_status)
+                except Exception:
+                    pass
+        self._reset_totals()
         # Always return hopper to safe OFF state after session end.
-        if self.coin_hopper:
+        if hopper:
             try:
-                self.coin_hopper.ensure_relays_off()
+                hopper.ensure_relays_off()
             except Exception:
                 pass
+        self._cancel_update()
         self._callback = None
         self._change_callback = None
         return total_received, change_amount, change_status
 
     def cleanup(self):
         """Clean up GPIO resources."""
+        coin_acceptor = self.coin_acceptor
+        hopper = self.coin_hopper
+        bill_acceptor = self.bill_acceptor
         try:
-            if self.coin_acceptor:
-                self.coin_acceptor.cleanup()
+            if coin_acceptor:
+                coin_acceptor.cleanup()
         except Exception as e:
             logger.debug(f"Error cleaning up coin acceptor: {e}")
             pass
             
-        if self.coin_hopper:
+        if hopper:
             try:
-                self.coin_hopper.cleanup()
+                hopper.cleanup()
             except Exception:
                 pass
         
-        if self.bill_acceptor:
+        if bill_acceptor:
             try:
-                self.bill_acceptor.disconnect()
+                bill_acceptor.disconnect()
             except Exception:
                 pass
@@ -23,6 +23,11 @@ except ImportError:
     SENSOR_LOGGER_AVAILABLE = False
 
 
+def _round_reading(value):
+    """Round a sensor reading to 0.1 for change detection (None stays None)."""
+    return None if value is None else round(value, 1)
+
+
 class TECController:
     """
     Controls a TEC Peltier module via GPIO relay.
@@ -42,7 +47,8 @@ class TECController:
                  average_sensors=True,
                  use_esp32_serial=False,
                  esp32_port=None,
-                 esp32_baud=115200):
+                 esp32_baud=115200,
+                 change_only=False):
         """
         Initialize TEC controller.
         
@@ -52,6 +58,8 @@ class TECController:
             target_temp (float): Target temperature in Celsius (default 10°C)
             temp_hysteresis (float): Temperature range tolerance (default ±1°C)
             average_sensors (bool): If True, average multiple sensor readings; if False, use highest temp
+            change_only (bool): If True, only call the status/DHT callbacks when a reading changes
+                by at least 0.1 (°C or %RH) or the TEC state flips
         """
         self.relay_pin = relay_pin
         self.average_sensors = average_sensors
@@ -113,6 +121,9 @@ class TECController:
         # Callbacks for UI updates
         self._on_status_update = None  # Called with (enabled, current_temp, target_temp)
         self._on_dht_update = None  # Called with (sensor_number, temperature, humidity)
+        self.change_only = change_only
+        self._last_status_pushed = None  # (enabled, rounded temp) last sent to _on_status_update
+        self._last_dht_pushed = {}  # sensor_number -> (rounded temp, rounded humidity)
         
         # Initialize sensor data logger
         self.sensor_logger = None
@@ -163,7 +174,9 @@ class TECController:
                         self.last_update_time = time.time()
                     
                     # Call status callback if registered
-                    if self._on_status_update:
+                    status_key = (self.is_enabled, round(control_temp, 1))
+                    if self._on_status_update and not (self.change_only and status_key == self._last_status_pushed):
+                        self._last_status_pushed = status_key
                         try:
                             self._on_status_update(
                                 enabled=self.is_enabled,
@@ -184,6 +197,10 @@ class TECController:
                             with self._lock:
                                 temp = self.sensor_temps.get(pin)
                                 humid = self.sensor_humidities.get(pin)
+                            dht_key = (_round_reading(temp), _round_reading(humid))
+                            if self.change_only and self._last_dht_pushed.get(idx + 1) == dht_key:
+                                continue
+                            self._last_dht_pushed[idx + 1] = dht_key
                             try:
                                 # sensor_number: 1-based index
                                 self._on_dht_update(idx+1, temp, humid)
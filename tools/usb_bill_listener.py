@@ -80,7 +80,7 @@ def main():
                     if up.startswith('BILL:'):
                         try:
                             val = int(line.split(':',1)[1])
-                            print(f"  -> Parsed bill: â‚±{val}")
+                            print(f"  -> Parsed bill: ₱{val}")
                         except Exception:
                             print('  -> Unrecognized BILL line')
                 continue
@@ -91,7 +91,7 @@ def main():
             if up.startswith('BILL:'):
                 try:
                     val = int(line.split(':',1)[1])
-                    print(f"  -> Parsed bill: â‚±{val}")
+                    print(f"  -> Parsed bill: ₱{val}")
                 except Exception:
                     print('  -> Unrecognized BILL line')
     except KeyboardInterrupt: